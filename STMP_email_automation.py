@@ -1,4 +1,3 @@
-import pandas as pd
 import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -7,36 +6,260 @@ from email.mime.base import MIMEBase
 from email import encoders
 import datetime
 import os
+import contextlib
+import html
 import logging
+import logging.handlers
+import queue
+import socket
+import threading
+import time
 import traceback
-from typing import Optional, List, Dict
+from dataclasses import dataclass, replace
+from typing import Callable, Optional, List, Dict, Tuple
 from dotenv import load_dotenv
 
 # Import the card generator
-from card_generation import BirthdayAnniversaryGenerator
+from card_generation import BirthdayAnniversaryGenerator, getenv_bool, getenv_int, reset_logger_handlers
+
+logger = logging.getLogger(__name__)
+
+# SMTP reply codes worth retrying with backoff (temporary server-side conditions)
+TRANSIENT_SMTP_CODES = {421, 450, 451, 452, 454}
+SMTP_RETRY_ATTEMPTS = 3
+
+# Greeting email body; the personalised card is embedded as cid:greeting_card
+EMAIL_HTML_BODY = """
+            <html>
+                <body>
+                    <img src="cid:greeting_card" style="max-width: 600px; height: auto;">
+                </body>
+            </html>
+            """
+
+# Greeting email body when cards are not personalised; the greeting is shown above the template card
+EMAIL_GREETING_HTML_BODY = """
+            <html>
+                <body>
+                    <h2>{greeting}</h2>
+                    <img src="cid:greeting_card" style="max-width: 600px; height: auto;">
+                </body>
+            </html>
+            """
+
+
+class ResolvedSMTP(smtplib.SMTP):
+    """
+    smtplib.SMTP that connects to already resolved addresses
+    
+    The hostname is still used for the SMTP greeting and TLS certificate checks,
+    only the DNS lookup is skipped.
+    """
+    def __init__(self, host: str, port: int, addresses: List[Tuple], **kwargs):
+        self._addresses = addresses
+        super().__init__(host, port, **kwargs)
+    
+    def _get_socket(self, host, port, timeout):
+        # Try each getaddrinfo() entry in turn (IPv4 or IPv6), as socket.create_connection does
+        error = None
+        for family, socktype, proto, _, sockaddr in self._addresses:
+            sock = socket.socket(family, socktype, proto)
+            try:
+                if timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+                    sock.settimeout(timeout)
+                if self.source_address:
+                    sock.bind(self.source_address)
+                sock.connect(sockaddr)
+                return sock
+            except OSError as e:
+                error = e
+                sock.close()
+        raise error or OSError(f"No addresses to connect to for {host}:{port}")
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    SMTP automation settings parsed once from the environment
+    
+    Build with Config.from_env() after load_dotenv().
+    """
+    # Email configuration
+    smtp_server: str
+    smtp_port: int
+    sender_email: Optional[str]
+    email_password: Optional[str]
+    
+    # File and folder configuration
+    output_folder: str
+    csv_file: str
+    birthday_card: str
+    anniversary_card: str
+    
+    # Text positioning
+    birthday_text_position: Tuple[int, int]
+    anniversary_text_position: Tuple[int, int]
+    
+    # Font customization
+    birthday_font_size: int
+    anniversary_font_size: int
+    birthday_font_color: str
+    anniversary_font_color: str
+    birthday_font_path: str
+    anniversary_font_path: str
+    
+    # Alignment
+    birthday_center_align: bool
+    anniversary_center_align: bool
+    
+    # Cards
+    personalize_cards: bool
+    card_render_workers: int
+    card_max_width: int
+    card_jpeg_quality: int
+    employee_date_format: str
+    
+    # Reporting
+    always_send_report: bool
+    
+    # Sending
+    smtp_concurrency: int
+    smtp_max_messages_per_connection: int
+    smtp_max_consecutive_failures: int
+    
+    @classmethod
+    def from_env(cls) -> 'Config':
+        """Parse every setting from the current environment in one pass"""
+        return cls(
+            smtp_server=os.getenv('SMTP_SERVER', 'smtp.gmail.com'),
+            smtp_port=getenv_int('SMTP_PORT', '587'),
+            sender_email=os.getenv('SENDER_EMAIL'),
+            email_password=os.getenv('EMAIL_PASSWORD'),
+            output_folder=os.getenv('OUTPUT_FOLDER', 'output'),
+            csv_file=os.getenv('CSV_FILE', 'employees_test_today.csv'),
+            birthday_card=os.getenv('BIRTHDAY_CARD', 'assets\\Slide2.PNG'),
+            anniversary_card=os.getenv('ANNIVERSARY_CARD', 'assets\\Slide1.PNG'),
+            birthday_text_position=(getenv_int('BIRTHDAY_TEXT_X', '50'), getenv_int('BIRTHDAY_TEXT_Y', '300')),
+            anniversary_text_position=(getenv_int('ANNIVERSARY_TEXT_X', '0'), getenv_int('ANNIVERSARY_TEXT_Y', '200')),
+            birthday_font_size=getenv_int('BIRTHDAY_FONT_SIZE', '64'),
+            anniversary_font_size=getenv_int('ANNIVERSARY_FONT_SIZE', '72'),
+            birthday_font_color=os.getenv('BIRTHDAY_FONT_COLOR', '#4b446a'),
+            anniversary_font_color=os.getenv('ANNIVERSARY_FONT_COLOR', '#72719f'),
+            birthday_font_path=os.getenv('BIRTHDAY_FONT_PATH', 'fonts/Inkfree.ttf'),
+            anniversary_font_path=os.getenv('ANNIVERSARY_FONT_PATH', 'C:/Windows/Fonts/HTOWERT.TTF'),
+            birthday_center_align=getenv_bool('BIRTHDAY_CENTER_ALIGN', 'false'),
+            anniversary_center_align=getenv_bool('ANNIVERSARY_CENTER_ALIGN', 'true'),
+            personalize_cards=getenv_bool('PERSONALIZE_CARDS', 'true'),
+            card_render_workers=getenv_int('CARD_RENDER_WORKERS', '1'),
+            card_max_width=getenv_int('CARD_MAX_WIDTH', '0'),
+            card_jpeg_quality=getenv_int('CARD_JPEG_QUALITY', '95'),
+            employee_date_format=os.getenv('EMPLOYEE_DATE_FORMAT', '%Y-%m-%d'),
+            always_send_report=getenv_bool('ALWAYS_SEND_REPORT', 'false'),
+            smtp_concurrency=getenv_int('SMTP_CONCURRENCY', '1'),
+            smtp_max_messages_per_connection=getenv_int('SMTP_MAX_MESSAGES_PER_CONNECTION', '100'),
+            smtp_max_consecutive_failures=getenv_int('SMTP_MAX_CONSECUTIVE_FAILURES', '10')
+        )
+    
+    def smtp_kwargs(self) -> Dict:
+        """Keyword arguments for SMTPEmailAutomation()"""
+        return {
+            'smtp_server': self.smtp_server,
+            'smtp_port': self.smtp_port,
+            'email': self.sender_email,
+            'password': self.email_password,
+            'output_folder': self.output_folder,
+            'personalize_cards': self.personalize_cards,
+            'card_render_workers': self.card_render_workers,
+            'card_max_width': self.card_max_width,
+            'card_jpeg_quality': self.card_jpeg_quality,
+            'employee_date_format': self.employee_date_format,
+            'always_send_report': self.always_send_report,
+            'concurrency': self.smtp_concurrency,
+            'max_messages_per_connection': self.smtp_max_messages_per_connection,
+            'max_consecutive_failures': self.smtp_max_consecutive_failures
+        }
+    
+    def automation_kwargs(self) -> Dict:
+        """Keyword arguments for SMTPEmailAutomation.run_daily_automation()"""
+        return {
+            'csv_file': self.csv_file,
+            'birthday_card_path': self.birthday_card,
+            'anniversary_card_path': self.anniversary_card,
+            'birthday_text_pos': self.birthday_text_position,
+            'anniversary_text_pos': self.anniversary_text_position,
+            'birthday_font_size': self.birthday_font_size,
+            'anniversary_font_size': self.anniversary_font_size,
+            'birthday_font_color': self.birthday_font_color,
+            'anniversary_font_color': self.anniversary_font_color,
+            'birthday_font_path': self.birthday_font_path,
+            'anniversary_font_path': self.anniversary_font_path,
+            'birthday_center_align': self.birthday_center_align,
+            'anniversary_center_align': self.anniversary_center_align
+        }
+
 
 class SMTPEmailAutomation:
     def __init__(self, smtp_server: Optional[str] = None, smtp_port: Optional[int] = None, 
                  email: Optional[str] = None, password: Optional[str] = None, 
-                 output_folder: str = "output"):
+                 output_folder: Optional[str] = None, always_send_report: Optional[bool] = None,
+                 concurrency: Optional[int] = None, max_messages_per_connection: Optional[int] = None,
+                 max_consecutive_failures: Optional[int] = None, personalize_cards: Optional[bool] = None,
+                 card_render_workers: Optional[int] = None, card_max_width: Optional[int] = None,
+                 card_jpeg_quality: Optional[int] = None, employee_date_format: Optional[str] = None):
         """
         Initialize SMTP email automation system with card generation
         
+        Every argument left as None is taken from Config.from_env(), which holds the defaults.
+        
         Args:
-            smtp_server: SMTP server (e.g., 'smtp.gmail.com') - will use env var if None
-            smtp_port: SMTP port (e.g., 587 for TLS) - will use env var if None
-            email: Sender email address - will use env var if None
-            password: Email password or app password - will use env var if None
+            smtp_server: SMTP server (e.g., 'smtp.gmail.com')
+            smtp_port: SMTP port (e.g., 587 for TLS)
+            email: Sender email address
+            password: Email password or app password
             output_folder: Folder to save generated images and logs
+            always_send_report: Send the daily report even on days with no emails or errors
+            concurrency: Number of parallel SMTP connections per batch (keep within provider limits)
+            max_messages_per_connection: Reconnect after this many messages on one connection
+            max_consecutive_failures: Give up on the rest of a batch after this many failed sends in a row
+            personalize_cards: Render each employee's name onto their card; if False the template is sent
+                as is and the greeting goes in the email text
+            card_render_workers: Number of processes used to render cards
+            card_max_width: Scale finished cards down to this width in pixels (0 keeps the template size)
+            card_jpeg_quality: JPEG quality of finished cards (1-95)
+            employee_date_format: strptime format of the birthday/anniversary columns
         """
-        # Load environment variables
+        # Load environment variables; the environment is parsed once, by Config
         load_dotenv()
         
-        self.smtp_server = smtp_server or os.getenv('SMTP_SERVER')
-        self.smtp_port = smtp_port or int(os.getenv('SMTP_PORT', '587'))
-        self.sender_email = email or os.getenv('SENDER_EMAIL')
-        self.password = password or os.getenv('EMAIL_PASSWORD')
-        self.output_folder = output_folder
+        given = {
+            'smtp_server': smtp_server,
+            'smtp_port': smtp_port,
+            'sender_email': email,
+            'email_password': password,
+            'output_folder': output_folder,
+            'always_send_report': always_send_report,
+            'smtp_concurrency': concurrency,
+            'smtp_max_messages_per_connection': max_messages_per_connection,
+            'smtp_max_consecutive_failures': max_consecutive_failures,
+            'personalize_cards': personalize_cards,
+            'card_render_workers': card_render_workers,
+            'card_max_width': card_max_width,
+            'card_jpeg_quality': card_jpeg_quality,
+            'employee_date_format': employee_date_format
+        }
+        config = replace(Config.from_env(), **{name: value for name, value in given.items() if value is not None})
+        
+        self.smtp_server = config.smtp_server
+        self.smtp_port = config.smtp_port
+        self.sender_email = config.sender_email
+        self.password = config.email_password
+        self.output_folder = config.output_folder
+        self.always_send_report = config.always_send_report
+        self.personalize_cards = config.personalize_cards
+        # Explicit 0 is kept as given and clamped to 1
+        self.concurrency = max(1, config.smtp_concurrency)
+        self.max_messages_per_connection = max(1, config.smtp_max_messages_per_connection)
+        self.max_consecutive_failures = max(1, config.smtp_max_consecutive_failures)
         
         # Validate required configuration
         if not all([self.smtp_server, self.sender_email, self.password]):
@@ -51,12 +274,18 @@ class SMTPEmailAutomation:
             raise ValueError("Email password must be a valid string")
         
         # Create output and logs folders if they don't exist
-        os.makedirs(output_folder, exist_ok=True)
-        self.logs_folder = os.path.join(output_folder, "logs")
+        os.makedirs(self.output_folder, exist_ok=True)
+        self.logs_folder = os.path.join(self.output_folder, "logs")
         os.makedirs(self.logs_folder, exist_ok=True)
         
         # Initialize card generator
-        self.card_generator = BirthdayAnniversaryGenerator(output_folder)
+        self.card_generator = BirthdayAnniversaryGenerator(
+            self.output_folder,
+            render_workers=config.card_render_workers,
+            date_format=config.employee_date_format,
+            max_width=config.card_max_width,
+            jpeg_quality=config.card_jpeg_quality
+        )
         
         # Setup logging
         self.setup_logging()
@@ -76,6 +305,27 @@ class SMTPEmailAutomation:
             'end_time': None
         }
         
+        # Guards against sending the daily report twice in one run
+        self._report_sent = False
+        
+        # Per-thread authenticated connection shared by a batch of emails (see smtp_session)
+        self._smtp_local = threading.local()
+        
+        # Stats counters are updated from SMTP worker threads
+        self._stats_lock = threading.Lock()
+        
+        # Failed sends in a row within the current batch (see run_email_batch)
+        self._consecutive_failures = 0
+        
+        # SMTP server addresses (getaddrinfo entries), resolved on first connect and reused by every reconnect
+        self._smtp_addresses: Optional[List[Tuple]] = None
+        
+        # The HTML part is the same for every recipient, so it is encoded once and attached to each message
+        self._html_part = MIMEText(EMAIL_HTML_BODY, 'html')
+        
+        # Encoded image parts for card templates sent unpersonalized, keyed by path
+        self._template_image_parts: Dict[str, MIMEImage] = {}
+        
     def setup_logging(self):
         """Setup logging configuration"""
         log_filename = os.path.join(self.logs_folder, "email_log.log")
@@ -91,6 +341,14 @@ class SMTPEmailAutomation:
         file_handler.setFormatter(formatter)
         file_handler.setLevel(logging.INFO)
         
+        # Buffer file writes, flushing in batches or as soon as an error is logged
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        buffered_handler.setLevel(logging.INFO)
+        
         # Setup console handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
@@ -100,25 +358,34 @@ class SMTPEmailAutomation:
         self.logger = logging.getLogger('SMTPEmailAutomation')
         self.logger.setLevel(logging.INFO)
         
-        # Clear existing handlers to avoid duplicates
-        self.logger.handlers.clear()
+        # Clear existing handlers to avoid duplicates, writing out anything they still buffer
+        reset_logger_handlers(self.logger)
         
         # Add handlers
-        self.logger.addHandler(file_handler)
+        self.logger.addHandler(buffered_handler)
         self.logger.addHandler(console_handler)
         
         self.log_file_path = log_filename
+        self.log_file_basename = os.path.basename(log_filename)
         self.logger.info("SMTP Email Automation system initialized")
         self.logger.info(f"Output folder: {self.output_folder}")
         self.logger.info(f"Logs folder: {self.logs_folder}")
         self.logger.info(f"SMTP Server: {self.smtp_server}:{self.smtp_port}")
         self.logger.info(f"Sender Email: {self.sender_email}")
         
+    def flush_logs(self):
+        """Write any buffered log records to the log file"""
+        for handler in self.logger.handlers:
+            handler.flush()
+    
     def log_error(self, error_msg: str, exception: Optional[Exception] = None):
         """Log error and add to stats"""
         if exception:
-            full_error = f"{error_msg}: {str(exception)}\n{traceback.format_exc()}"
+            # Format the traceback once; it goes both into the log and into the stats
+            error_traceback = ''.join(traceback.format_exception(exception))
+            full_error = f"{error_msg}: {str(exception)}\n{error_traceback}"
         else:
+            error_traceback = None
             full_error = error_msg
             
         self.logger.error(full_error)
@@ -126,13 +393,19 @@ class SMTPEmailAutomation:
             'timestamp': datetime.datetime.now().isoformat(),
             'message': error_msg,
             'exception': str(exception) if exception else None,
-            'traceback': traceback.format_exc() if exception else None
+            'traceback': error_traceback
         })
     
     def create_email_message(self, recipient_email: str, recipient_name: str, 
-                           subject: str, body: str, image_bytes: Optional[bytes]) -> Optional[MIMEMultipart]:
+                           subject: str, body: str, image_bytes: Optional[bytes],
+                           greeting: Optional[str] = None,
+                           image_part: Optional[MIMEImage] = None) -> Optional[MIMEMultipart]:
         """
         Create email message with personalized greeting card
+        
+        If greeting is given (cards not personalized) it is written above the card
+        in the HTML body. A ready-made image_part (see load_template_image_part) is
+        attached as is instead of encoding image_bytes.
         """
         try:
             self.logger.info(f"Creating email message for {recipient_name} ({recipient_email})")
@@ -147,22 +420,19 @@ class SMTPEmailAutomation:
             msg['To'] = recipient_email
             msg['Subject'] = subject
             
-            # Create HTML body that references the embedded image
-            html_body = f"""
-            <html>
-                <body>
-                    <img src="cid:greeting_card" style="max-width: 600px; height: auto;">
-                </body>
-            </html>
-            """
-            
-            msg.attach(MIMEText(html_body, 'html'))
+            if greeting:
+                # Template card, so the greeting goes in the HTML body instead
+                msg.attach(MIMEText(EMAIL_GREETING_HTML_BODY.format(greeting=html.escape(greeting)), 'html'))
+            else:
+                # HTML body that references the embedded image (shared, identical for every recipient)
+                msg.attach(self._html_part)
             
-            # Attach the personalized image
-            if image_bytes:
-                img = MIMEImage(image_bytes)
-                img.add_header('Content-ID', '<greeting_card>')
-                msg.attach(img)
+            # Attach the personalized image (cards are always JPEG, so skip subtype sniffing)
+            if image_part is None and image_bytes:
+                image_part = MIMEImage(image_bytes, _subtype='jpeg')
+                image_part.add_header('Content-ID', '<greeting_card>')
+            if image_part is not None:
+                msg.attach(image_part)
                 self.logger.info(f"Image attached to email for {recipient_name}")
             
             self.logger.info(f"Email message created successfully for {recipient_name}")
@@ -172,35 +442,164 @@ class SMTPEmailAutomation:
             self.log_error(f"Error creating email message for {recipient_email}", e)
             return None
     
+    def load_template_image_part(self, card_path: str) -> MIMEImage:
+        """
+        Image part for an unpersonalized card template, base64-encoded once and shared by every email
+        
+        Args:
+            card_path: Path to the card template
+        """
+        image_part = self._template_image_parts.get(card_path)
+        if image_part is None:
+            with open(card_path, 'rb') as f:
+                image_part = MIMEImage(f.read())
+            image_part.add_header('Content-ID', '<greeting_card>')
+            image_part = self._template_image_parts.setdefault(card_path, image_part)
+        return image_part
+    
+    def connect_smtp(self) -> smtplib.SMTP:
+        """
+        Open an SMTP connection, upgrade it to TLS and log in
+        
+        Returns:
+            smtplib.SMTP: Authenticated connection, to be closed with close_smtp()
+        """
+        # Type safety: Ensure required attributes are strings
+        if not isinstance(self.smtp_server, str) or not isinstance(self.sender_email, str) or not isinstance(self.password, str):
+            raise ValueError("Invalid email configuration - missing required string values")
+        
+        server = self._open_smtp_socket()
+        try:
+            server.starttls()
+            self.logger.info(f"SMTP connection established, authenticating...")
+            
+            server.login(self.sender_email, self.password)
+            self.logger.info(f"SMTP authentication successful")
+        except Exception:
+            server.close()
+            raise
+        
+        return server
+    
+    def _open_smtp_socket(self) -> smtplib.SMTP:
+        """Connect to the SMTP server, resolving its hostname only once per run"""
+        if self._smtp_addresses is None:
+            self._smtp_addresses = socket.getaddrinfo(self.smtp_server, self.smtp_port, type=socket.SOCK_STREAM)
+        
+        try:
+            return ResolvedSMTP(self.smtp_server, self.smtp_port, self._smtp_addresses)
+        except Exception:
+            # The server may have moved; look it up again on the next attempt
+            self._smtp_addresses = None
+            raise
+    
+    def close_smtp(self, server: smtplib.SMTP):
+        """Politely close an SMTP connection, dropping it if the server already hung up"""
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    
+    @property
+    def _smtp_connection(self) -> Optional[smtplib.SMTP]:
+        """This thread's shared SMTP connection, if inside smtp_session()"""
+        return getattr(self._smtp_local, 'connection', None)
+    
+    def _open_shared_connection(self):
+        """(Re)open this thread's shared SMTP connection"""
+        self._smtp_local.connection = None
+        self._smtp_local.connection = self.connect_smtp()
+        self._smtp_local.messages_sent = 0
+    
+    def _close_shared_connection(self):
+        """Close this thread's shared SMTP connection, if any"""
+        connection = self._smtp_connection
+        self._smtp_local.connection = None
+        if connection is not None:
+            self.close_smtp(connection)
+    
+    @contextlib.contextmanager
+    def smtp_session(self):
+        """
+        Reuse one authenticated SMTP connection for every send_email() call in the block
+        
+        The connection belongs to the calling thread. If it cannot be opened,
+        send_email() falls back to connecting per message so each failure is still
+        logged and counted against its recipient. Nested sessions reuse the outer
+        connection.
+        """
+        if self._smtp_connection is not None:
+            yield
+            return
+        
+        try:
+            self._open_shared_connection()
+        except Exception as e:
+            self.log_error("Could not open shared SMTP connection", e)
+        
+        try:
+            yield
+        finally:
+            self._close_shared_connection()
+    
+    def _deliver(self, msg: MIMEMultipart, recipient: str):
+        """Hand one message to the SMTP server, raising on failure"""
+        if self._smtp_connection is None:
+            server = self.connect_smtp()
+            try:
+                server.send_message(msg, self.sender_email, recipient)
+            finally:
+                self.close_smtp(server)
+            return
+        
+        # Recycle long-lived connections before providers start refusing them
+        if self._smtp_local.messages_sent >= self.max_messages_per_connection:
+            self.logger.info(f"Sent {self._smtp_local.messages_sent} messages on this connection, reconnecting")
+            self._close_shared_connection()
+            self._open_shared_connection()
+        
+        try:
+            self._smtp_connection.send_message(msg, self.sender_email, recipient)
+        except smtplib.SMTPServerDisconnected:
+            self.logger.warning("SMTP connection lost, reconnecting...")
+            self._open_shared_connection()
+            self._smtp_connection.send_message(msg, self.sender_email, recipient)
+        self._smtp_local.messages_sent += 1
+    
     def send_email(self, msg: Optional[MIMEMultipart]) -> bool:
         """
         Send email using SMTP with error handling
+        
+        Uses the shared connection when called inside smtp_session(), reconnecting
+        once if the server dropped it; otherwise opens a connection for this message.
+        Temporary server errors (4xx) are retried with exponential backoff.
         """
         if not msg:
             self.logger.error("Cannot send email: message is None")
             return False
+        
+        # Stop hammering a server that keeps failing; the rest of the batch is counted as failed
+        if self._consecutive_failures >= self.max_consecutive_failures:
+            self.logger.warning(f"Skipping email to {msg['To']}: too many consecutive SMTP failures")
+            return False
             
         try:
             recipient = msg['To']
             self.logger.info(f"Attempting to send email to {recipient}")
             
-            # Type safety: Ensure required attributes are strings
-            if not isinstance(self.smtp_server, str) or not isinstance(self.sender_email, str) or not isinstance(self.password, str):
-                self.log_error("Invalid email configuration - missing required string values")
-                return False
-                
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            self.logger.info(f"SMTP connection established, authenticating...")
-            
-            server.login(self.sender_email, self.password)
-            self.logger.info(f"SMTP authentication successful")
-            
-            text = msg.as_string()
-            server.sendmail(self.sender_email, recipient, text)
-            server.quit()
+            for attempt in range(1, SMTP_RETRY_ATTEMPTS + 1):
+                try:
+                    self._deliver(msg, recipient)
+                    break
+                except smtplib.SMTPResponseException as e:
+                    if e.smtp_code not in TRANSIENT_SMTP_CODES or attempt == SMTP_RETRY_ATTEMPTS:
+                        raise
+                    delay = 2 ** (attempt - 1)
+                    self.logger.warning(f"Temporary SMTP error {e.smtp_code} sending to {recipient}, retrying in {delay}s")
+                    time.sleep(delay)
             
             self.logger.info(f"Email sent successfully to {recipient}")
+            self._record_send_result(True)
             return True
             
         except smtplib.SMTPAuthenticationError as e:
@@ -211,9 +610,70 @@ class SMTPEmailAutomation:
             self.log_error(f"SMTP server disconnected when sending to {msg['To']}", e)
         except Exception as e:
             self.log_error(f"Error sending email to {msg['To']}", e)
-            
+        
+        self._record_send_result(False)
         return False
     
+    def _record_send_result(self, sent: bool):
+        """Track failed sends in a row, logging once when the batch gives up"""
+        with self._stats_lock:
+            if sent:
+                self._consecutive_failures = 0
+                return
+            self._consecutive_failures += 1
+            tripped = self._consecutive_failures == self.max_consecutive_failures
+        if tripped:
+            self.log_error(f"{self.max_consecutive_failures} emails failed in a row, skipping the rest of this batch")
+    
+    def _increment_stat(self, key: str):
+        """Thread-safe increment of a stats counter"""
+        with self._stats_lock:
+            self.stats[key] += 1
+    
+    def run_email_batch(self, jobs: List[Tuple], send_one: Callable[..., None]):
+        """
+        Call send_one(*job) for every job over up to self.concurrency SMTP connections
+        
+        Each worker thread keeps its own authenticated connection for the jobs it
+        takes from the shared queue. send_one must handle its own errors. After
+        max_consecutive_failures failed sends in a row, send_email() skips the rest
+        of the batch; the count starts over with every batch.
+        """
+        self._consecutive_failures = 0
+        try:
+            self._run_email_jobs(jobs, send_one)
+        finally:
+            self._consecutive_failures = 0
+    
+    def _run_email_jobs(self, jobs: List[Tuple], send_one: Callable[..., None]):
+        """Send a batch serially or over a pool of worker threads (see run_email_batch)"""
+        workers = min(self.concurrency, len(jobs))
+        if workers <= 1:
+            with self.smtp_session():
+                for job in jobs:
+                    send_one(*job)
+            return
+        
+        self.logger.info(f"Sending {len(jobs)} emails over {workers} SMTP connections")
+        job_queue: queue.Queue = queue.Queue()
+        for job in jobs:
+            job_queue.put(job)
+        
+        def worker():
+            with self.smtp_session():
+                while True:
+                    try:
+                        job = job_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    send_one(*job)
+        
+        threads = [threading.Thread(target=worker, name=f"smtp-worker-{n}") for n in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    
     def process_birthday_emails(self, birthdays: List[Dict], birthday_cards: List[str]):
         """
         Process and send birthday emails with generated cards
@@ -224,51 +684,73 @@ class SMTPEmailAutomation:
         """
         self.logger.info(f"Processing {len(birthdays)} birthday emails")
         
-        for i, (birthday_info, card_path) in enumerate(zip(birthdays, birthday_cards)):
+        total = len(birthdays)
+        jobs = [(i, total, birthday_info, card_path)
+                for i, (birthday_info, card_path) in enumerate(zip(birthdays, birthday_cards))]
+        self.run_email_batch(jobs, self.process_birthday_email)
+    
+    def process_birthday_email(self, i: int, total: int, birthday_info: Dict, card_path: str):
+        """
+        Send a single birthday email, recording the outcome in stats
+        
+        Args:
+            i: Position of this email in the batch (0-based)
+            total: Number of emails in the batch
+            birthday_info: Birthday information dictionary
+            card_path: Path to the generated birthday card
+        """
+        try:
+            first_name = birthday_info['first_name']
+            last_name = birthday_info['last_name']
+            email = birthday_info['email']
+            age = birthday_info['age']
+            
+            self.logger.info(f"Processing birthday email {i+1}/{total} for {first_name} {last_name} (age {age})")
+            
+            # Read the generated card image (a shared template is read and encoded once per run)
+            image_bytes = None
+            image_part = None
             try:
-                first_name = birthday_info['first_name']
-                last_name = birthday_info['last_name']
-                email = birthday_info['email']
-                age = birthday_info['age']
-                
-                self.logger.info(f"Processing birthday email {i+1}/{len(birthdays)} for {first_name} {last_name} (age {age})")
-                
-                # Read the generated card image
-                try:
+                if self.personalize_cards:
                     with open(card_path, 'rb') as f:
                         image_bytes = f.read()
-                    self.logger.info(f"Loaded birthday card image: {card_path}")
-                except Exception as e:
-                    self.log_error(f"Failed to read birthday card image: {card_path}", e)
-                    self.stats['birthday_emails_failed'] += 1
-                    continue
-                
-                # Create email
-                subject = f"Happy Birthday, {first_name}! 🎉"
-                body = ""  # No body text needed as image contains the message
-                
-                msg = self.create_email_message(
-                    email, first_name, subject, body, image_bytes
-                )
-                
-                # Send email
-                if msg and self.send_email(msg):
-                    self.stats['birthday_emails_sent'] += 1
-                    self.logger.info(f"Birthday email sent successfully to {first_name} {last_name}")
-                    
-                    # Add to stats
-                    self.stats['birthdays_today'].append({
-                        'name': f"{first_name} {last_name}",
-                        'email': email,
-                        'age': age
-                    })
                 else:
-                    self.stats['birthday_emails_failed'] += 1
-                    self.log_error(f"Failed to send birthday email to {first_name} {last_name}")
-                        
+                    image_part = self.load_template_image_part(card_path)
+                self.logger.info(f"Loaded birthday card image: {card_path}")
             except Exception as e:
-                self.stats['birthday_emails_failed'] += 1
-                self.log_error(f"Error processing birthday email for {birthday_info.get('first_name', 'Unknown')}", e)
+                self.log_error(f"Failed to read birthday card image: {card_path}", e)
+                self._increment_stat('birthday_emails_failed')
+                return
+            
+            # Create email
+            subject = f"Happy Birthday, {first_name}! 🎉"
+            body = ""  # No body text needed as image contains the message
+            
+            # Name goes in the email text when it is not drawn on the card
+            greeting = None if self.personalize_cards else f"Happy Birthday {first_name}!"
+            
+            msg = self.create_email_message(
+                email, first_name, subject, body, image_bytes, greeting, image_part
+            )
+            
+            # Send email
+            if msg and self.send_email(msg):
+                self._increment_stat('birthday_emails_sent')
+                self.logger.info(f"Birthday email sent successfully to {first_name} {last_name}")
+                
+                # Add to stats
+                self.stats['birthdays_today'].append({
+                    'name': f"{first_name} {last_name}",
+                    'email': email,
+                    'age': age
+                })
+            else:
+                self._increment_stat('birthday_emails_failed')
+                self.log_error(f"Failed to send birthday email to {first_name} {last_name}")
+                
+        except Exception as e:
+            self._increment_stat('birthday_emails_failed')
+            self.log_error(f"Error processing birthday email for {birthday_info.get('first_name', 'Unknown')}", e)
     
     def process_anniversary_emails(self, anniversaries: List[Dict], anniversary_cards: List[str]):
         """
@@ -280,51 +762,81 @@ class SMTPEmailAutomation:
         """
         self.logger.info(f"Processing {len(anniversaries)} anniversary emails")
         
-        for i, (anniversary_info, card_path) in enumerate(zip(anniversaries, anniversary_cards)):
+        total = len(anniversaries)
+        jobs = [(i, total, anniversary_info, card_path)
+                for i, (anniversary_info, card_path) in enumerate(zip(anniversaries, anniversary_cards))]
+        self.run_email_batch(jobs, self.process_anniversary_email)
+    
+    def process_anniversary_email(self, i: int, total: int, anniversary_info: Dict, card_path: str):
+        """
+        Send a single anniversary email, recording the outcome in stats
+        
+        Args:
+            i: Position of this email in the batch (0-based)
+            total: Number of emails in the batch
+            anniversary_info: Anniversary information dictionary
+            card_path: Path to the generated anniversary card
+        """
+        try:
+            first_name = anniversary_info['first_name']
+            last_name = anniversary_info['last_name']
+            email = anniversary_info['email']
+            years = anniversary_info['years']
+            
+            self.logger.info(f"Processing anniversary email {i+1}/{total} for {first_name} {last_name} ({years} years)")
+            
+            # Read the generated card image (a shared template is read and encoded once per run)
+            image_bytes = None
+            image_part = None
             try:
-                first_name = anniversary_info['first_name']
-                last_name = anniversary_info['last_name']
-                email = anniversary_info['email']
-                years = anniversary_info['years']
-                
-                self.logger.info(f"Processing anniversary email {i+1}/{len(anniversaries)} for {first_name} {last_name} ({years} years)")
-                
-                # Read the generated card image
-                try:
+                if self.personalize_cards:
                     with open(card_path, 'rb') as f:
                         image_bytes = f.read()
-                    self.logger.info(f"Loaded anniversary card image: {card_path}")
-                except Exception as e:
-                    self.log_error(f"Failed to read anniversary card image: {card_path}", e)
-                    self.stats['anniversary_emails_failed'] += 1
-                    continue
-                
-                # Create email
-                subject = f"Happy Anniversary, {first_name}! 💕"
-                body = ""  # No body text needed as image contains the message
-                
-                msg = self.create_email_message(
-                    email, first_name, subject, body, image_bytes
-                )
-                
-                # Send email
-                if msg and self.send_email(msg):
-                    self.stats['anniversary_emails_sent'] += 1
-                    self.logger.info(f"Anniversary email sent successfully to {first_name} {last_name} ({years} years)")
-                    
-                    # Add to stats
-                    self.stats['anniversaries_today'].append({
-                        'name': f"{first_name} {last_name}",
-                        'email': email,
-                        'years': years
-                    })
                 else:
-                    self.stats['anniversary_emails_failed'] += 1
-                    self.log_error(f"Failed to send anniversary email to {first_name} {last_name}")
-                        
+                    image_part = self.load_template_image_part(card_path)
+                self.logger.info(f"Loaded anniversary card image: {card_path}")
             except Exception as e:
-                self.stats['anniversary_emails_failed'] += 1
-                self.log_error(f"Error processing anniversary email for {anniversary_info.get('first_name', 'Unknown')}", e)
+                self.log_error(f"Failed to read anniversary card image: {card_path}", e)
+                self._increment_stat('anniversary_emails_failed')
+                return
+            
+            # Create email
+            subject = f"Happy Anniversary, {first_name}! 💕"
+            body = ""  # No body text needed as image contains the message
+            
+            # Name goes in the email text when it is not drawn on the card
+            greeting = None if self.personalize_cards else f"Happy Anniversary {first_name}!"
+            
+            msg = self.create_email_message(
+                email, first_name, subject, body, image_bytes, greeting, image_part
+            )
+            
+            # Send email
+            if msg and self.send_email(msg):
+                self._increment_stat('anniversary_emails_sent')
+                self.logger.info(f"Anniversary email sent successfully to {first_name} {last_name} ({years} years)")
+                
+                # Add to stats
+                self.stats['anniversaries_today'].append({
+                    'name': f"{first_name} {last_name}",
+                    'email': email,
+                    'years': years
+                })
+            else:
+                self._increment_stat('anniversary_emails_failed')
+                self.log_error(f"Failed to send anniversary email to {first_name} {last_name}")
+                
+        except Exception as e:
+            self._increment_stat('anniversary_emails_failed')
+            self.log_error(f"Error processing anniversary email for {anniversary_info.get('first_name', 'Unknown')}", e)
+    
+    def _has_activity(self) -> bool:
+        """Check whether today's run sent any emails or hit any errors"""
+        return bool(
+            self.stats['birthday_emails_sent']
+            or self.stats['anniversary_emails_sent']
+            or self.stats['errors']
+        )
     
     def create_summary_report(self) -> str:
         """Create a summary report of the day's activities"""
@@ -359,22 +871,32 @@ TOTAL SUMMARY:
 
         """
         
+        # Collect sections in a list and join once instead of growing the string
+        parts = [report]
+        
         if self.stats['birthdays_today']:
-            report += "\nBIRTHDAYS TODAY:\n"
-            for birthday in self.stats['birthdays_today']:
-                report += f"- {birthday['name']} ({birthday['email']}) - Age: {birthday['age']}\n"
+            parts.append("\nBIRTHDAYS TODAY:\n")
+            parts.extend(
+                f"- {birthday['name']} ({birthday['email']}) - Age: {birthday['age']}\n"
+                for birthday in self.stats['birthdays_today']
+            )
         
         if self.stats['anniversaries_today']:
-            report += "\nANNIVERSARIES TODAY:\n"
-            for anniversary in self.stats['anniversaries_today']:
-                report += f"- {anniversary['name']} ({anniversary['email']}) - {anniversary['years']} years\n"
+            parts.append("\nANNIVERSARIES TODAY:\n")
+            parts.extend(
+                f"- {anniversary['name']} ({anniversary['email']}) - {anniversary['years']} years\n"
+                for anniversary in self.stats['anniversaries_today']
+            )
         
         if self.stats['errors']:
-            report += f"\nERRORS ENCOUNTERED ({len(self.stats['errors'])}):\n"
-            for i, error in enumerate(self.stats['errors'], 1):
-                report += f"{i}. {error['timestamp']} - {error['message']}\n"
-                if error['exception']:
-                    report += f"   Exception: {error['exception']}\n"
+            parts.append(f"\nERRORS ENCOUNTERED ({len(self.stats['errors'])}):\n")
+            parts.extend(
+                f"{i}. {error['timestamp']} - {error['message']}\n"
+                + (f"   Exception: {error['exception']}\n" if error['exception'] else "")
+                for i, error in enumerate(self.stats['errors'], 1)
+            )
+        
+        report = ''.join(parts)
         
         self.logger.info("Summary report generated")
         return report
@@ -390,9 +912,11 @@ TOTAL SUMMARY:
                 return
                 
             report = self.create_summary_report()
+            today = datetime.date.today()
             
             # Save report to file
-            report_filename = os.path.join(self.output_folder, f"daily_report_{datetime.date.today().strftime('%Y%m%d')}.txt")
+            report_basename = f"daily_report_{today:%Y%m%d}.txt"
+            report_filename = os.path.join(self.output_folder, report_basename)
             with open(report_filename, 'w', encoding='utf-8') as f:
                 f.write(report)
             self.logger.info(f"Daily report saved to: {report_filename}")
@@ -401,43 +925,44 @@ TOTAL SUMMARY:
             msg = MIMEMultipart()
             msg['From'] = self.sender_email
             msg['To'] = self.sender_email
-            msg['Subject'] = f"SMTP Email Automation Daily Report - {datetime.date.today().strftime('%Y-%m-%d')}"
+            msg['Subject'] = f"SMTP Email Automation Daily Report - {today:%Y-%m-%d}"
             
             # Add report as email body
             msg.attach(MIMEText(report, 'plain'))
             
             # Attach log file
             try:
+                self.flush_logs()
                 with open(self.log_file_path, 'rb') as f:
                     log_attachment = MIMEBase('application', 'octet-stream')
                     log_attachment.set_payload(f.read())
                     encoders.encode_base64(log_attachment)
                     log_attachment.add_header(
                         'Content-Disposition',
-                        f'attachment; filename= {os.path.basename(self.log_file_path)}'
+                        f'attachment; filename= {self.log_file_basename}'
                     )
                     msg.attach(log_attachment)
                 self.logger.info("Log file attached to daily report")
             except Exception as e:
                 self.logger.warning(f"Could not attach log file: {e}")
             
-            # Attach report file
+            # Attach report file (same bytes just written, no need to re-read it)
             try:
-                with open(report_filename, 'rb') as f:
-                    report_attachment = MIMEBase('application', 'octet-stream')
-                    report_attachment.set_payload(f.read())
-                    encoders.encode_base64(report_attachment)
-                    report_attachment.add_header(
-                        'Content-Disposition',
-                        f'attachment; filename= {os.path.basename(report_filename)}'
-                    )
-                    msg.attach(report_attachment)
+                report_attachment = MIMEBase('application', 'octet-stream')
+                report_attachment.set_payload(report.encode('utf-8'))
+                encoders.encode_base64(report_attachment)
+                report_attachment.add_header(
+                    'Content-Disposition',
+                    f'attachment; filename= {report_basename}'
+                )
+                msg.attach(report_attachment)
                 self.logger.info("Report file attached to daily report")
             except Exception as e:
                 self.logger.warning(f"Could not attach report file: {e}")
             
             # Send the report
             if self.send_email(msg):
+                self._report_sent = True
                 self.logger.info("Daily report sent successfully")
             else:
                 self.logger.error("Failed to send daily report")
@@ -496,17 +1021,22 @@ TOTAL SUMMARY:
                 birthday_font_path=birthday_font_path,
                 anniversary_font_path=anniversary_font_path,
                 birthday_center_align=birthday_center_align,
-                anniversary_center_align=anniversary_center_align
+                anniversary_center_align=anniversary_center_align,
+                personalize=self.personalize_cards
             )
             
             if not result['success']:
                 self.log_error(f"Card generation failed: {result.get('error', 'Unknown error')}")
                 return False
             
-            self.stats['birthday_cards_generated'] = len(result['birthday_cards_created'])
-            self.stats['anniversary_cards_generated'] = len(result['anniversary_cards_created'])
-            
-            self.logger.info(f"Cards generated successfully - Birthday: {self.stats['birthday_cards_generated']}, Anniversary: {self.stats['anniversary_cards_generated']}")
+            if self.personalize_cards:
+                self.stats['birthday_cards_generated'] = len(result['birthday_cards_created'])
+                self.stats['anniversary_cards_generated'] = len(result['anniversary_cards_created'])
+                
+                self.logger.info(f"Cards generated successfully - Birthday: {self.stats['birthday_cards_generated']}, Anniversary: {self.stats['anniversary_cards_generated']}")
+            else:
+                # Every recipient gets the unchanged template, so no cards were generated
+                self.logger.info("Card personalization disabled - sending the card templates unchanged")
             
             # Step 2: Send birthday emails
             if result['birthday_cards_created']:
@@ -529,8 +1059,11 @@ TOTAL SUMMARY:
                 self.logger.info("No anniversary emails to send today")
             
             # Step 4: Send daily report
-            self.logger.info("Step 4: Sending daily report")
-            self.send_daily_report()
+            if self.always_send_report or self._has_activity():
+                self.logger.info("Step 4: Sending daily report")
+                self.send_daily_report()
+            else:
+                self.logger.info("Step 4: No emails sent and no errors today, skipping daily report")
             
             # Final statistics
             self.stats['end_time'] = datetime.datetime.now()
@@ -548,11 +1081,9 @@ TOTAL SUMMARY:
             
         except Exception as e:
             self.log_error("Critical error in daily automation", e)
-            # Still try to send a report even if there was a critical error
-            try:
+            # Still send a report for the critical error, unless one already went out
+            if not self._report_sent:
                 self.send_daily_report()
-            except:
-                pass
             return False
 
 
@@ -567,85 +1098,33 @@ def main():
         # Load environment variables from .env file
         load_dotenv()
         
-        # Email configuration from environment variables
-        SMTP_SERVER = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
-        SMTP_PORT = int(os.getenv('SMTP_PORT', '587'))
-        SENDER_EMAIL = os.getenv('SENDER_EMAIL')
-        EMAIL_PASSWORD = os.getenv('EMAIL_PASSWORD')
-        
-        # File and folder configuration from environment variables
-        OUTPUT_FOLDER = os.getenv('OUTPUT_FOLDER', 'output')
-        CSV_FILE = os.getenv('CSV_FILE', 'employees_test_today.csv')
-        BIRTHDAY_CARD = os.getenv('BIRTHDAY_CARD', 'assets\\Slide2.PNG')
-        ANNIVERSARY_CARD = os.getenv('ANNIVERSARY_CARD', 'assets\\Slide1.PNG')
-        
-        # Text positioning for 1280x720 images from .env
-        BIRTHDAY_TEXT_X = int(os.getenv('BIRTHDAY_TEXT_X', '50'))
-        BIRTHDAY_TEXT_Y = int(os.getenv('BIRTHDAY_TEXT_Y', '300'))
-        ANNIVERSARY_TEXT_X = int(os.getenv('ANNIVERSARY_TEXT_X', '0'))
-        ANNIVERSARY_TEXT_Y = int(os.getenv('ANNIVERSARY_TEXT_Y', '200'))
-        
-        BIRTHDAY_TEXT_POSITION = (BIRTHDAY_TEXT_X, BIRTHDAY_TEXT_Y)
-        ANNIVERSARY_TEXT_POSITION = (ANNIVERSARY_TEXT_X, ANNIVERSARY_TEXT_Y)
-        
-        # Font customization from .env
-        BIRTHDAY_FONT_SIZE = int(os.getenv('BIRTHDAY_FONT_SIZE', '64'))
-        ANNIVERSARY_FONT_SIZE = int(os.getenv('ANNIVERSARY_FONT_SIZE', '72'))
-        BIRTHDAY_FONT_COLOR = os.getenv('BIRTHDAY_FONT_COLOR', '#4b446a')
-        ANNIVERSARY_FONT_COLOR = os.getenv('ANNIVERSARY_FONT_COLOR', '#72719f')
-        
-        # Font paths from .env
-        BIRTHDAY_FONT_PATH = os.getenv('BIRTHDAY_FONT_PATH', 'fonts/Inkfree.ttf')
-        ANNIVERSARY_FONT_PATH = os.getenv('ANNIVERSARY_FONT_PATH', 'C:/Windows/Fonts/HTOWERT.TTF')
-        
-        # Alignment from .env
-        BIRTHDAY_CENTER_ALIGN = os.getenv('BIRTHDAY_CENTER_ALIGN', 'false').lower() == 'true'
-        ANNIVERSARY_CENTER_ALIGN = os.getenv('ANNIVERSARY_CENTER_ALIGN', 'true').lower() == 'true'
+        # Parse all configuration from environment variables once
+        cfg = Config.from_env()
         
         # Validate required environment variables
-        if not SENDER_EMAIL or not EMAIL_PASSWORD:
+        if not cfg.sender_email or not cfg.email_password:
             print("❌ Error: SENDER_EMAIL and EMAIL_PASSWORD environment variables are required!")
             print("Please create a .env file with your email configuration.")
             return
         
         print("📋 Configuration Summary:")
-        print(f"   📧 Sender Email: {SENDER_EMAIL}")
-        print(f"   🏢 SMTP Server: {SMTP_SERVER}:{SMTP_PORT}")
-        print(f"   📁 Output Folder: {OUTPUT_FOLDER}")
-        print(f"   📊 CSV File: {CSV_FILE}")
-        print(f"   🎂 Birthday Template: {BIRTHDAY_CARD}")
-        print(f"   💕 Anniversary Template: {ANNIVERSARY_CARD}")
-        print(f"   🎨 Birthday Font: {BIRTHDAY_FONT_PATH} (Size: {BIRTHDAY_FONT_SIZE}, Color: {BIRTHDAY_FONT_COLOR})")
-        print(f"   🎨 Anniversary Font: {ANNIVERSARY_FONT_PATH} (Size: {ANNIVERSARY_FONT_SIZE}, Color: {ANNIVERSARY_FONT_COLOR})")
-        print(f"   📍 Birthday Position: {BIRTHDAY_TEXT_POSITION} {'(Center Aligned)' if BIRTHDAY_CENTER_ALIGN else ''}")
-        print(f"   📍 Anniversary Position: {ANNIVERSARY_TEXT_POSITION} {'(Center Aligned)' if ANNIVERSARY_CENTER_ALIGN else ''}")
+        print(f"   📧 Sender Email: {cfg.sender_email}")
+        print(f"   🏢 SMTP Server: {cfg.smtp_server}:{cfg.smtp_port}")
+        print(f"   📁 Output Folder: {cfg.output_folder}")
+        print(f"   📊 CSV File: {cfg.csv_file}")
+        print(f"   🎂 Birthday Template: {cfg.birthday_card}")
+        print(f"   💕 Anniversary Template: {cfg.anniversary_card}")
+        print(f"   🎨 Birthday Font: {cfg.birthday_font_path} (Size: {cfg.birthday_font_size}, Color: {cfg.birthday_font_color})")
+        print(f"   🎨 Anniversary Font: {cfg.anniversary_font_path} (Size: {cfg.anniversary_font_size}, Color: {cfg.anniversary_font_color})")
+        print(f"   📍 Birthday Position: {cfg.birthday_text_position} {'(Center Aligned)' if cfg.birthday_center_align else ''}")
+        print(f"   📍 Anniversary Position: {cfg.anniversary_text_position} {'(Center Aligned)' if cfg.anniversary_center_align else ''}")
         print()
         
         # Initialize SMTP email automation
-        email_system = SMTPEmailAutomation(
-            smtp_server=SMTP_SERVER,
-            smtp_port=SMTP_PORT,
-            email=SENDER_EMAIL,
-            password=EMAIL_PASSWORD,
-            output_folder=OUTPUT_FOLDER
-        )
+        email_system = SMTPEmailAutomation(**cfg.smtp_kwargs())
         
         # Run daily automation
-        success = email_system.run_daily_automation(
-            csv_file=CSV_FILE, 
-            birthday_card_path=BIRTHDAY_CARD, 
-            anniversary_card_path=ANNIVERSARY_CARD,
-            birthday_text_pos=BIRTHDAY_TEXT_POSITION,
-            anniversary_text_pos=ANNIVERSARY_TEXT_POSITION,
-            birthday_font_size=BIRTHDAY_FONT_SIZE,
-            anniversary_font_size=ANNIVERSARY_FONT_SIZE,
-            birthday_font_color=BIRTHDAY_FONT_COLOR,
-            anniversary_font_color=ANNIVERSARY_FONT_COLOR,
-            birthday_font_path=BIRTHDAY_FONT_PATH,
-            anniversary_font_path=ANNIVERSARY_FONT_PATH,
-            birthday_center_align=BIRTHDAY_CENTER_ALIGN,
-            anniversary_center_align=ANNIVERSARY_CENTER_ALIGN
-        )
+        success = email_system.run_daily_automation(**cfg.automation_kwargs())
         
         if success:
             print("✅ SMTP Email automation completed successfully!")
@@ -654,8 +1133,11 @@ def main():
         
     except Exception as e:
         print(f"❌ Critical error in main execution: {e}")
-        import traceback
-        traceback.print_exc()
+        logging.basicConfig(
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        logger.exception("Critical error in main execution")
 
 
 def create_env_template():
@@ -677,6 +1159,10 @@ CSV_FILE=employees_test_today.csv
 BIRTHDAY_CARD=assets\\Slide2.PNG
 ANNIVERSARY_CARD=assets\\Slide1.PNG
 
+# Employee Data
+# Format of the birthday/anniversary dates in CSV_FILE (strptime codes, default ISO)
+EMPLOYEE_DATE_FORMAT=%Y-%m-%d
+
 # IMAGE SPECIFICATIONS
 # ===================
 # This configuration is optimized for 1280x720 greeting card images
@@ -740,6 +1226,32 @@ ANNIVERSARY_FONT_PATH=C:/Windows/Fonts/HTOWERT.TTF
 # Text Alignment (anniversary cards are center-aligned by default)
 ANNIVERSARY_CENTER_ALIGN=true
 
+# CARD RENDERING:
+# ===============
+# Set to false to send the card templates unchanged, with the greeting in the email text
+PERSONALIZE_CARDS=true
+# Number of processes used to render cards (1 renders in the main process)
+CARD_RENDER_WORKERS=1
+# Scale finished cards down to this width in pixels (0 keeps the template size)
+CARD_MAX_WIDTH=0
+# JPEG quality of finished cards (1-95)
+CARD_JPEG_QUALITY=95
+
+# SENDING:
+# ========
+# Number of parallel SMTP connections used per batch (Gmail allows about 15)
+SMTP_CONCURRENCY=1
+# Reconnect after this many messages on one connection
+SMTP_MAX_MESSAGES_PER_CONNECTION=100
+# Give up on the rest of a batch after this many failed sends in a row
+SMTP_MAX_CONSECUTIVE_FAILURES=10
+
+# DAILY REPORT:
+# =============
+# By default the daily report is only sent when emails went out or errors occurred
+# Set to true to receive a report every day, even when nothing happened
+ALWAYS_SEND_REPORT=false
+
 # LAYOUT EXPLANATION:
 # ==================
 # Birthday Layout:    "Happy Birthday John"     (single line)
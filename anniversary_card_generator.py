@@ -1,28 +1,48 @@
 from PIL import Image, ImageDraw, ImageFont
-import random
+import numpy as np
 import os
+from birthday_card_generator import load_cached_overlay
+
+# Bump whenever create_confetti_overlay draws differently, so overlays cached by an older version are drawn again
+CONFETTI_VERSION = 2
 
 class AnniversaryImageCreator:
+    # Decoded, thumbnailed assets shared by every instance: (path, max size) -> RGBA image
+    asset_cache = {}
+    # Loaded fonts shared by every instance (see load_fonts)
+    shared_fonts = {}
+    # Seed for the confetti layout, so a redrawn overlay matches the cached one
+    confetti_seed = 42
+
     def __init__(self, base_image_path=None):
         self.base_image_path = base_image_path
-        self.fonts_loaded = False
         self.fonts = {}
         self.base_image = None
+        self.confetti_overlay = None
         self.assets_folder = "assets"
+        self.output_folder = "output"
+        # The cached overlay is only valid for the drawing code and seed it was made with
+        self.confetti_overlay_path = os.path.join(
+            self.output_folder, f"anniversary_confetti_overlay_v{CONFETTI_VERSION}_seed{self.confetti_seed}.png"
+        )
+        self.load_fonts()
 
     def load_fonts(self):
-        if self.fonts_loaded:
+        # Fonts are parsed once per process and shared by every instance
+        if self.shared_fonts:
+            self.fonts = self.shared_fonts
             return
         try:
-            self.fonts = {
+            fonts = {
                 'header': ImageFont.truetype("arialbd.ttf", 32),
                 'main': ImageFont.truetype("arialbd.ttf", 72),
                 'sub': ImageFont.truetype("arialbd.ttf", 24)
             }
         except:
             default_font = ImageFont.load_default()
-            self.fonts = {k: default_font for k in ['header', 'main', 'sub']}
-        self.fonts_loaded = True
+            fonts = {k: default_font for k in ['header', 'main', 'sub']}
+        self.shared_fonts.update(fonts)
+        self.fonts = self.shared_fonts
 
     def draw_star(self, draw, x, y, size, color):
         # A simple 5-point star approximation
@@ -50,8 +70,18 @@ class AnniversaryImageCreator:
             (x, y + size * 2)
         ], fill=color)
 
+    def load_asset(self, filename, max_size):
+        # Decode and shrink each asset once per process; pasting does not modify it
+        key = (os.path.join(self.assets_folder, filename), max_size)
+        asset = self.asset_cache.get(key)
+        if asset is None:
+            with Image.open(key[0]) as source:
+                asset = source.convert("RGBA")
+            asset.thumbnail(max_size)
+            self.asset_cache[key] = asset
+        return asset
+
     def create_base_image(self):
-        self.load_fonts()
 
         if self.base_image_path and os.path.exists(self.base_image_path):
             self.base_image = Image.open(self.base_image_path).convert('RGB')
@@ -63,9 +93,7 @@ class AnniversaryImageCreator:
 
         # Airtel logo
         try:
-            logo_path = os.path.join(self.assets_folder, "airtel_logo.png")
-            logo = Image.open(logo_path).convert("RGBA")
-            logo.thumbnail((100, 100))
+            logo = self.load_asset("airtel_logo.png", (100, 100))
             img.paste(logo, (width - logo.width - 20, 20), mask=logo)
         except Exception as e:
             print(f"Logo load failed: {e}")
@@ -97,26 +125,44 @@ class AnniversaryImageCreator:
             y += 30
 
         # Confetti (stars and hearts)
+        # Only the bottom band has confetti, so blend just that strip instead of the whole card
+        confetti_img = self.load_confetti_overlay(img.size)
+        confetti_box = confetti_img.getbbox()
+        if confetti_box:
+            confetti_band = confetti_img.crop(confetti_box)
+            img.paste(confetti_band, confetti_box[:2], mask=confetti_band)
+        self.base_image = img
+        return self.base_image
+
+    def create_confetti_overlay(self, size):
+        width, height = size
         shapes = ['star', 'heart']
         confetti_colors = ['#ffffff', '#ff69b4', '#ff1493', '#ffd700', '#ffb6c1']
-        confetti_img = Image.new('RGBA', img.size, (255, 0, 0, 0))
+        confetti_img = Image.new('RGBA', size, (255, 0, 0, 0))
         confetti_draw = ImageDraw.Draw(confetti_img)
 
-        for _ in range(80):
-            x = random.randint(0, width)
-            y = random.randint(height - 150, height)
-            size = random.randint(8, 16)
-            color = random.choice(confetti_colors)
-            shape = random.choice(shapes)
+        # Draw all random positions, sizes, colours and shapes in one go
+        rng = np.random.default_rng(self.confetti_seed)
+        count = 80
+        xs = rng.integers(0, width, count, endpoint=True).tolist()
+        ys = rng.integers(height - 150, height, count, endpoint=True).tolist()
+        sizes = rng.integers(8, 16, count, endpoint=True).tolist()
+        colors = rng.choice(confetti_colors, count).tolist()
+        shape_picks = rng.choice(shapes, count).tolist()
 
+        for x, y, size, color, shape in zip(xs, ys, sizes, colors, shape_picks):
             if shape == 'star':
                 self.draw_star(confetti_draw, x, y, size // 2, color)
             else:
                 self.draw_heart(confetti_draw, x, y, size // 2, color)
 
-        img = Image.alpha_composite(img.convert('RGBA'), confetti_img)
-        self.base_image = img.convert('RGB')
-        return self.base_image
+        return confetti_img
+
+    def load_confetti_overlay(self, size):
+        # Draw the 80 stars and hearts once and reuse them, in memory and across runs via the output folder
+        if self.confetti_overlay is None or self.confetti_overlay.size != size:
+            self.confetti_overlay = load_cached_overlay(self.confetti_overlay_path, size, self.create_confetti_overlay)
+        return self.confetti_overlay
 
 def create_anniversary_card():
     creator = AnniversaryImageCreator()
@@ -124,7 +170,7 @@ def create_anniversary_card():
 
     os.makedirs(creator.assets_folder, exist_ok=True)
     output_path = os.path.join(creator.assets_folder, "anniversary_card.png")
-    img.save(output_path)
+    img.save(output_path, format='PNG', compress_level=1, optimize=False)
     print(f"Image saved to {output_path}")
 
 if __name__ == "__main__":
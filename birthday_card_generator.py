@@ -1,32 +1,82 @@
 from PIL import Image, ImageDraw, ImageFont
-import random
+import numpy as np
 import os
 
+# Confetti colours (white, gold, aqua, pink, light blue) as RGB rows, parsed once
+CONFETTI_RGB = np.array([
+    (0xff, 0xff, 0xff), (0xff, 0xd7, 0x00), (0x00, 0xff, 0xcc), (0xff, 0x69, 0xb4), (0xad, 0xd8, 0xe6)
+], dtype=np.uint8)
+
+# Bump whenever create_confetti_overlay draws differently, so overlays cached by an older version are drawn again
+CONFETTI_VERSION = 2
+
+def load_cached_overlay(path, size, create_overlay):
+    # Reuse an overlay saved by an earlier run, or draw it and save it for the next one
+    try:
+        with Image.open(path) as cached:
+            if cached.size == size:
+                return cached.convert('RGBA')
+    except (OSError, ValueError):
+        pass
+
+    overlay = create_overlay(size)
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        overlay.save(path, format='PNG', compress_level=1)
+    except OSError as e:
+        print(f"Confetti overlay cache save failed: {e}")
+    return overlay
+
 class BirthdayImageCreator:
+    # Decoded, thumbnailed assets shared by every instance: (path, max size) -> RGBA image
+    asset_cache = {}
+    # Loaded fonts shared by every instance (see load_fonts)
+    shared_fonts = {}
+    # Seed for the confetti layout, so a redrawn overlay matches the cached one
+    confetti_seed = 42
+
     def __init__(self, base_image_path=None):
         self.base_image_path = base_image_path
-        self.fonts_loaded = False
         self.fonts = {}
         self.base_image = None
+        self.confetti_overlay = None
         self.assets_folder = "assets"
+        self.output_folder = "output"
+        # The cached overlay is only valid for the drawing code and seed it was made with
+        self.confetti_overlay_path = os.path.join(
+            self.output_folder, f"confetti_overlay_v{CONFETTI_VERSION}_seed{self.confetti_seed}.png"
+        )
+        self.load_fonts()
 
     def load_fonts(self):
-        if self.fonts_loaded:
+        # Fonts are parsed once per process and shared by every instance
+        if self.shared_fonts:
+            self.fonts = self.shared_fonts
             return
         try:
-            self.fonts = {
+            fonts = {
                 'header': ImageFont.truetype("arialbd.ttf", 32),
                 'main': ImageFont.truetype("arialbd.ttf", 72),
                 'sub': ImageFont.truetype("arialbd.ttf", 24)
             }
         except:
             default_font = ImageFont.load_default()
-            self.fonts = {k: default_font for k in ['header', 'main', 'sub']}
-        self.fonts_loaded = True
+            fonts = {k: default_font for k in ['header', 'main', 'sub']}
+        self.shared_fonts.update(fonts)
+        self.fonts = self.shared_fonts
+
+    def load_asset(self, filename, max_size):
+        # Decode and shrink each asset once per process; pasting does not modify it
+        key = (os.path.join(self.assets_folder, filename), max_size)
+        asset = self.asset_cache.get(key)
+        if asset is None:
+            with Image.open(key[0]) as source:
+                asset = source.convert("RGBA")
+            asset.thumbnail(max_size)
+            self.asset_cache[key] = asset
+        return asset
 
     def create_base_image(self):
-        self.load_fonts()
-
         if self.base_image_path and os.path.exists(self.base_image_path):
             self.base_image = Image.open(self.base_image_path).convert('RGB')
             return self.base_image
@@ -37,9 +87,7 @@ class BirthdayImageCreator:
 
         # Airtel logo
         try:
-            logo_path = os.path.join(self.assets_folder, "airtel_logo.png")
-            logo = Image.open(logo_path).convert("RGBA")
-            logo.thumbnail((100, 100))
+            logo = self.load_asset("airtel_logo.png", (100, 100))
             img.paste(logo, (width - logo.width - 20, 20), mask=logo)
         except Exception as e:
             print(f"Logo load failed: {e}")
@@ -59,9 +107,7 @@ class BirthdayImageCreator:
 
         # Cake image
         try:
-            cake_path = os.path.join(self.assets_folder, "cake.png")
-            cake = Image.open(cake_path).convert("RGBA")
-            cake.thumbnail((150, 150))
+            cake = self.load_asset("cake.png", (150, 150))
             cake_x = (width - cake.width) // 2
             cake_y = vertical_offset + 160
             img.paste(cake, (cake_x, cake_y), mask=cake)
@@ -81,24 +127,46 @@ class BirthdayImageCreator:
             draw.text(((width - line_w) // 2, y), line, fill="white", font=self.fonts['sub'])
             y += 30
 
-        # Confetti
-        confetti_colors = ['#ffffff', '#ffd700', '#00ffcc', '#ff69b4', '#add8e6']
-        confetti_img = Image.new('RGBA', img.size, (255, 0, 0, 0))
-        confetti_draw = ImageDraw.Draw(confetti_img)
-
-        for _ in range(100):
-            x = random.randint(0, width)
-            y = random.randint(height - 120, height)
-            r = random.randint(2, 4)
-            color = random.choice(confetti_colors)
-            alpha = int(255 * (y - (height - 120)) / 120)
-            rgba = tuple(int(color[i:i+2], 16) for i in (1, 3, 5)) + (alpha,)
-            confetti_draw.ellipse((x - r, y - r, x + r, y + r), fill=rgba)
-
-        img = Image.alpha_composite(img.convert('RGBA'), confetti_img)
-        self.base_image = img.convert('RGB')
+        # Confetti only covers the bottom band, so blend just that strip instead of the whole card
+        confetti_img = self.load_confetti_overlay(img.size)
+        confetti_box = confetti_img.getbbox()
+        if confetti_box:
+            confetti_band = confetti_img.crop(confetti_box)
+            img.paste(confetti_band, confetti_box[:2], mask=confetti_band)
+        self.base_image = img
         return self.base_image
 
+    def create_confetti_overlay(self, size):
+        width, height = size
+
+        # Pick all 100 dots at once: position, radius, colour, and alpha fading in towards the bottom
+        rng = np.random.default_rng(self.confetti_seed)
+        count = 100
+        xs = rng.integers(0, width, count, endpoint=True)
+        ys = rng.integers(height - 120, height, count, endpoint=True)
+        rs = rng.integers(2, 4, count, endpoint=True)
+        colors = CONFETTI_RGB[rng.integers(0, len(CONFETTI_RGB), count)]
+        alphas = (255 * (ys - (height - 120)) // 120).astype(np.uint8)
+
+        # Stamp every dot in one go: a 9x9 grid of offsets around each centre, masked to its radius
+        offsets = np.arange(-4, 5)
+        dx, dy = np.meshgrid(offsets, offsets)
+        px = xs[:, None, None] + dx
+        py = ys[:, None, None] + dy
+        inside = (dx ** 2 + dy ** 2 <= rs[:, None, None] ** 2) & (px >= 0) & (px < width) & (py >= 0) & (py < height)
+        dot = np.nonzero(inside)[0]
+
+        pixels = np.zeros((height, width, 4), dtype=np.uint8)
+        pixels[py[inside], px[inside], :3] = colors[dot]
+        pixels[py[inside], px[inside], 3] = alphas[dot]
+        return Image.fromarray(pixels, 'RGBA')
+
+    def load_confetti_overlay(self, size):
+        # Draw the confetti layer once and reuse it, in memory and across runs via the output folder
+        if self.confetti_overlay is None or self.confetti_overlay.size != size:
+            self.confetti_overlay = load_cached_overlay(self.confetti_overlay_path, size, self.create_confetti_overlay)
+        return self.confetti_overlay
+
 def create_birthday_card():
     creator = BirthdayImageCreator()
     img = creator.create_base_image()
@@ -108,7 +176,8 @@ def create_birthday_card():
 
     # Save image to assets folder
     output_path = os.path.join(creator.assets_folder, "birthday_card.png")
-    img.save(output_path)
+    # The card only uses a handful of colours, so an 8-bit palette PNG is a fraction of the RGB size
+    img.convert('P', palette=Image.ADAPTIVE, colors=64).save(output_path, optimize=True)
     print(f"Image saved to {output_path}")
 
 # Example usage
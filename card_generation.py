@@ -1,21 +1,117 @@
 import pandas as pd
 from PIL import Image, ImageDraw, ImageFont
 import datetime
+import glob
+import hashlib
 import os
 import io
+import importlib.util
 import logging
+import logging.handlers
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, List, Dict, Tuple
 from dotenv import load_dotenv
 
+
+# Columns read from the employee CSV; anything else in the file is skipped while parsing
+EMPLOYEE_COLUMNS = ['first_name', 'last_name', 'email', 'birthday', 'anniversary']
+REQUIRED_EMPLOYEE_COLUMNS = ['first_name', 'last_name', 'email', 'birthday']
+
+# pyarrow's multithreaded CSV reader is used when installed, otherwise pandas' C parser
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
+
+# Bump whenever parse_employee_csv stores different columns, so Parquet caches written by
+# an older version are parsed again
+CACHE_SCHEMA_VERSION = 2
+
+# Smaller batches are rendered in this process; starting a pool would cost more than it saves
+MIN_PARALLEL_CARDS = 4
+
+def getenv_int(name: str, default: str) -> int:
+    """Read an integer environment variable, naming the variable if its value is not a number"""
+    value = os.getenv(name, default)
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"Environment variable {name} must be an integer, got {value!r}") from None
+
+
+def getenv_bool(name: str, default: str) -> bool:
+    """Read a boolean environment variable; 'true', '1' and 'yes' (any case) count as True"""
+    return os.getenv(name, default).strip().lower() in {'true', '1', 'yes'}
+
+
+def reset_logger_handlers(logger: logging.Logger):
+    """Flush and close a logger's handlers, including the file behind a MemoryHandler, then remove them"""
+    for handler in logger.handlers:
+        handler.flush()
+        handler.close()
+        # MemoryHandler.close() leaves its target open, which would leak the log file descriptor
+        if isinstance(handler, logging.handlers.MemoryHandler) and handler.target is not None:
+            handler.target.close()
+    logger.handlers.clear()
+
+
+# Per-process generator used by render worker processes (see BirthdayAnniversaryGenerator.render_cards)
+_worker_generator = None
+
+
+def _init_render_worker(output_folder: str, templates: Dict[str, Image.Image], output_options: Dict):
+    """
+    Create one generator per worker process, seeded with the templates the parent already decoded
+    
+    With the fork start method the templates are inherited without copying; otherwise they
+    are sent once per worker, which still saves each worker decoding the file again.
+    """
+    global _worker_generator
+    _worker_generator = BirthdayAnniversaryGenerator(output_folder, render_workers=1, **output_options)
+    _worker_generator._card_cache.update(templates)
+
+
+def _render_card_in_worker(job: Tuple[str, str, str, Dict]) -> Optional[str]:
+    """Render one card in a worker process and return the saved path (None on failure)"""
+    image_path, text, output_filename, text_options = job
+    _, saved_path = _worker_generator.add_text_to_image(
+        image_path, text, output_filename=output_filename, **text_options
+    )
+    # Workers exit without running logging shutdown, so don't leave records in the buffer
+    _worker_generator.flush_logs()
+    return saved_path
+
+
 class BirthdayAnniversaryGenerator:
-    def __init__(self, output_folder: str = "output"):
+    # First system font that loaded, shared by every generator in the process (and by forked
+    # render workers), so other sizes and instances skip the search through font_paths
+    _system_font_path: Optional[str] = None
+    
+    def __init__(self, output_folder: str = "output", render_workers: Optional[int] = None,
+                 date_format: Optional[str] = None, max_width: Optional[int] = None,
+                 jpeg_quality: Optional[int] = None):
         """
         Initialize birthday and anniversary card generator
         
         Args:
             output_folder: Folder to save generated images and logs
+            render_workers: Number of processes used to render cards - will use
+                CARD_RENDER_WORKERS env var if None (default 1, render in this process)
+            date_format: strptime format of the birthday/anniversary columns - will use
+                EMPLOYEE_DATE_FORMAT env var if None (default ISO, %Y-%m-%d)
+            max_width: Scale finished cards down to this width, keeping the aspect ratio -
+                will use CARD_MAX_WIDTH env var if None (default 0, keep the template size)
+            jpeg_quality: JPEG quality of finished cards (1-95) - will use CARD_JPEG_QUALITY
+                env var if None (default 95)
         """
         self.output_folder = output_folder
+        if render_workers is None:
+            render_workers = getenv_int('CARD_RENDER_WORKERS', '1')
+        self.render_workers = max(1, render_workers)
+        self.date_format = date_format or os.getenv('EMPLOYEE_DATE_FORMAT', '%Y-%m-%d')
+        if max_width is None:
+            max_width = getenv_int('CARD_MAX_WIDTH', '0')
+        self.max_width = max(0, max_width)
+        if jpeg_quality is None:
+            jpeg_quality = getenv_int('CARD_JPEG_QUALITY', '95')
+        self.jpeg_quality = min(max(1, jpeg_quality), 95)
         
         # Create output folder if it doesn't exist
         os.makedirs(output_folder, exist_ok=True)
@@ -34,6 +130,22 @@ class BirthdayAnniversaryGenerator:
             'end_time': None
         }
         
+        # (month, day) -> row positions, built once per loaded DataFrame
+        self._indexed_df: Optional[pd.DataFrame] = None
+        self._date_indexes: Dict[str, Dict[Tuple[int, int], List[int]]] = {}
+        
+        # Decoded card templates keyed by path, never drawn on
+        self._card_cache: Dict[str, Image.Image] = {}
+        
+        # One reusable working image per template; only the text area is restored between cards
+        self._card_workspaces: Dict[str, Image.Image] = {}
+        
+        # Loaded fonts keyed by (custom font path, size), so each card does not reopen the font file
+        self._font_cache: Dict[Tuple[Optional[str], int], ImageFont.FreeTypeFont] = {}
+        
+        # Measured widths of card text lines keyed by (font, line); "Happy Anniversary" is the same on every card
+        self._text_widths: Dict[Tuple[ImageFont.FreeTypeFont, str], float] = {}
+        
     def setup_logging(self):
         """Setup logging configuration"""
         log_filename = os.path.join(self.output_folder, "card_generator.log")
@@ -49,6 +161,14 @@ class BirthdayAnniversaryGenerator:
         file_handler.setFormatter(formatter)
         file_handler.setLevel(logging.INFO)
         
+        # Buffer file writes, flushing in batches or as soon as an error is logged
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        buffered_handler.setLevel(logging.INFO)
+        
         # Setup console handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
@@ -58,22 +178,26 @@ class BirthdayAnniversaryGenerator:
         self.logger = logging.getLogger('CardGenerator')
         self.logger.setLevel(logging.INFO)
         
-        # Clear existing handlers to avoid duplicates
-        self.logger.handlers.clear()
+        # Clear existing handlers to avoid duplicates, writing out anything they still buffer
+        reset_logger_handlers(self.logger)
         
         # Add handlers
-        self.logger.addHandler(file_handler)
+        self.logger.addHandler(buffered_handler)
         self.logger.addHandler(console_handler)
         
+    def flush_logs(self):
+        """Write any buffered log records to the log file"""
+        for handler in self.logger.handlers:
+            handler.flush()
+        
     def log_error(self, error_msg: str, exception: Optional[Exception] = None):
         """Log error and add to stats"""
         if exception:
-            import traceback
-            full_error = f"{error_msg}: {str(exception)}\n{traceback.format_exc()}"
+            # The traceback is rendered by the log handlers, from the exception itself
+            self.logger.error(f"{error_msg}: {str(exception)}", exc_info=exception)
         else:
-            full_error = error_msg
+            self.logger.error(error_msg)
             
-        self.logger.error(full_error)
         self.stats['errors'].append({
             'timestamp': datetime.datetime.now().isoformat(),
             'message': error_msg,
@@ -101,51 +225,138 @@ class BirthdayAnniversaryGenerator:
             elif len(hex_color) != 6:
                 raise ValueError(f"Invalid hex color length: {hex_color}")
             
-            # Convert to RGB
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            
-            return (r, g, b)
+            # Parse once and split the channels out of the 24-bit value
+            value = int(hex_color, 16)
+            return ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
             
         except Exception as e:
             self.logger.warning(f"Invalid hex color '{hex_color}', using black as default: {e}")
             return (0, 0, 0)  # Default to black
         
+    def get_employee_cache_prefix(self, csv_file: str) -> str:
+        """
+        File name prefix shared by every Parquet cache of one CSV file
+        
+        It includes a hash of the CSV's absolute path, so CSVs with the same name in
+        different folders get separate caches.
+        """
+        csv_name = os.path.splitext(os.path.basename(csv_file))[0]
+        path_digest = hashlib.sha256(os.path.abspath(csv_file).encode('utf-8')).hexdigest()[:8]
+        return f"{csv_name}.{path_digest}"
+    
+    def get_employee_cache_path(self, csv_file: str) -> str:
+        """
+        Path of the Parquet cache for a CSV file, kept in the output folder
+        
+        The name includes a hash of the CSV's size and modification time, the date format
+        and CACHE_SCHEMA_VERSION, so any change to the file or to how it is parsed selects
+        a new cache.
+        """
+        stat = os.stat(csv_file)
+        signature = f"{CACHE_SCHEMA_VERSION}|{stat.st_size}|{stat.st_mtime_ns}|{self.date_format}"
+        digest = hashlib.sha256(signature.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.output_folder, f"{self.get_employee_cache_prefix(csv_file)}.{digest}.parquet")
+    
+    def read_employee_cache(self, csv_file: str) -> Optional[pd.DataFrame]:
+        """
+        Read the parsed employee data from its Parquet cache
+        
+        Returns:
+            DataFrame, or None if there is no cache for the current CSV and date format
+        """
+        cache_path = self.get_employee_cache_path(csv_file)
+        try:
+            if not os.path.exists(cache_path):
+                return None
+            df = pd.read_parquet(cache_path)
+            self.logger.info(f"Loaded {len(df)} employee records from cache {cache_path}")
+            return df
+        except Exception as e:
+            self.logger.warning(f"Could not read employee cache {cache_path}, parsing CSV instead: {e}")
+            return None
+    
+    def write_employee_cache(self, csv_file: str, df: pd.DataFrame):
+        """Save parsed employee data as Parquet so the next run can skip CSV and date parsing"""
+        cache_path = self.get_employee_cache_path(csv_file)
+        try:
+            df.to_parquet(cache_path, compression='zstd', index=False)
+            
+            # Drop caches written for earlier versions of the same CSV (same name and folder)
+            cache_prefix = glob.escape(self.get_employee_cache_prefix(csv_file))
+            for stale_path in glob.glob(os.path.join(self.output_folder, f"{cache_prefix}.*.parquet")):
+                if stale_path != cache_path:
+                    os.remove(stale_path)
+        except Exception as e:
+            # pyarrow is optional; without it every run simply parses the CSV
+            self.logger.warning(f"Could not write employee cache {cache_path}: {e}")
+    
+    def parse_employee_csv(self, csv_file: str) -> pd.DataFrame:
+        """
+        Parse and validate employee data from a CSV file
+        
+        Raises:
+            ValueError: If required columns are missing
+        """
+        # Validate required columns from the header before parsing the rows
+        header = pd.read_csv(csv_file, nrows=0).columns
+        missing_columns = [col for col in REQUIRED_EMPLOYEE_COLUMNS if col not in header]
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {missing_columns}")
+        
+        # Only read the columns we use, as strings, so no per-column type inference is needed
+        usecols = [col for col in EMPLOYEE_COLUMNS if col in header]
+        df = pd.read_csv(csv_file, usecols=usecols, dtype={col: 'string' for col in usecols}, engine=CSV_ENGINE)
+        self.logger.info(f"Loaded {len(df)} employee records from {csv_file}")
+        
+        # Trim stray whitespace from text columns in one vectorized pass per column
+        for column in ('first_name', 'last_name', 'email'):
+            if pd.api.types.is_string_dtype(df[column]):
+                df[column] = df[column].str.strip()
+        
+        # Convert date columns to datetime with error handling; a fixed format avoids per-value format guessing
+        try:
+            df['birthday'] = pd.to_datetime(df['birthday'], format=self.date_format, errors='coerce', cache=True)
+            invalid_birthdays = df[df['birthday'].isna()]['email'].tolist()
+            if invalid_birthdays:
+                self.logger.warning(f"Invalid birthday dates for employees: {invalid_birthdays}")
+        except Exception as e:
+            self.log_error("Error parsing birthday dates", e)
+            
+        if 'anniversary' in df.columns:
+            try:
+                raw_anniversaries = df['anniversary']
+                df['anniversary'] = pd.to_datetime(raw_anniversaries, format=self.date_format, errors='coerce', cache=True)
+                invalid_anniversaries = df[df['anniversary'].isna() & raw_anniversaries.notna()]['email'].tolist()
+                if invalid_anniversaries:
+                    self.logger.warning(f"Invalid anniversary dates for employees: {invalid_anniversaries}")
+            except Exception as e:
+                self.log_error("Error parsing anniversary dates", e)
+        
+        # Keep month and day as small integers (cached with the data) so lookups don't re-derive them
+        for column in ('birthday', 'anniversary'):
+            if column in df.columns and pd.api.types.is_datetime64_any_dtype(df[column]):
+                df[f'{column}_month'] = df[column].dt.month.astype('Int8')
+                df[f'{column}_day'] = df[column].dt.day.astype('Int8')
+        
+        return df
+    
     def load_employee_data(self, csv_file: str) -> pd.DataFrame:
         """
         Load employee data from CSV file with error handling
+        
+        Parsed data is cached as Parquet in the output folder and reused until the CSV changes.
         """
         try:
             if not os.path.exists(csv_file):
                 raise FileNotFoundError(f"CSV file not found: {csv_file}")
-                
-            df = pd.read_csv(csv_file)
-            self.logger.info(f"Loaded {len(df)} employee records from {csv_file}")
             
-            # Validate required columns
-            required_columns = ['first_name', 'last_name', 'email', 'birthday']
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                raise ValueError(f"Missing required columns: {missing_columns}")
+            df = self.read_employee_cache(csv_file)
+            if df is None:
+                df = self.parse_employee_csv(csv_file)
+                self.write_employee_cache(csv_file, df)
             
-            # Convert date columns to datetime with error handling
-            try:
-                df['birthday'] = pd.to_datetime(df['birthday'], errors='coerce')
-                invalid_birthdays = df[df['birthday'].isna()]['email'].tolist()
-                if invalid_birthdays:
-                    self.logger.warning(f"Invalid birthday dates for employees: {invalid_birthdays}")
-            except Exception as e:
-                self.log_error("Error parsing birthday dates", e)
-                
-            if 'anniversary' in df.columns:
-                try:
-                    df['anniversary'] = pd.to_datetime(df['anniversary'], errors='coerce')
-                    invalid_anniversaries = df[df['anniversary'].isna() & df['anniversary'].notna()]['email'].tolist()
-                    if invalid_anniversaries:
-                        self.logger.warning(f"Invalid anniversary dates for employees: {invalid_anniversaries}")
-                except Exception as e:
-                    self.log_error("Error parsing anniversary dates", e)
+            # Bucket rows by (month, day) so daily lookups don't rescan the frame
+            self.build_date_indexes(df)
             
             return df
             
@@ -153,6 +364,202 @@ class BirthdayAnniversaryGenerator:
             self.log_error(f"Error loading CSV file: {csv_file}", e)
             return pd.DataFrame()
     
+    def build_date_index(self, df: pd.DataFrame, column: str) -> Dict[Tuple[int, int], List[int]]:
+        """
+        Build a (month, day) -> row positions index for a date column
+        
+        Args:
+            df: Employee DataFrame with the date column already parsed
+            column: Name of the datetime column ('birthday' or 'anniversary')
+            
+        Returns:
+            dict: {(month, day): [row positions]}, rows with missing dates are skipped
+        """
+        date_parts = self.get_date_parts(df, column)
+        if date_parts is None:
+            return {}
+        
+        groups = df.groupby(list(date_parts)).indices
+        return {(int(month), int(day)): rows.tolist() for (month, day), rows in groups.items()}
+    
+    def get_date_parts(self, df: pd.DataFrame, column: str) -> Optional[Tuple[pd.Series, pd.Series]]:
+        """
+        Month and day of a date column, from the integer columns added by parse_employee_csv
+        
+        Returns:
+            (months, days), or None if the column is missing or not parsed as dates
+        """
+        if f'{column}_month' not in df.columns or f'{column}_day' not in df.columns:
+            return None
+        return df[f'{column}_month'], df[f'{column}_day']
+    
+    def build_date_indexes(self, df: pd.DataFrame):
+        """Build and remember the birthday/anniversary indexes for a DataFrame"""
+        try:
+            self._date_indexes = {
+                column: self.build_date_index(df, column)
+                for column in ('birthday', 'anniversary')
+            }
+            self._indexed_df = df
+        except Exception as e:
+            self._date_indexes = {}
+            self._indexed_df = None
+            self.log_error("Error building date indexes", e)
+    
+    def get_rows_for_date(self, df: pd.DataFrame, column: str, date: datetime.date) -> pd.DataFrame:
+        """
+        Get employees whose date column falls on the given month and day
+        
+        Uses the index built by load_employee_data when df is the loaded frame,
+        otherwise compares month and day across the whole column in one vectorized pass.
+        """
+        if df is self._indexed_df:
+            index = self._date_indexes.get(column, {})
+            return df.iloc[index.get((date.month, date.day), [])]
+        
+        # One-off lookup: a month/day mask is cheaper than grouping the whole frame into an index
+        date_parts = self.get_date_parts(df, column)
+        if date_parts is None:
+            return df.iloc[[]]
+        
+        months, days = date_parts
+        mask = ((months == date.month) & (days == date.day)).fillna(False).to_numpy(dtype=bool)
+        return df[mask]
+    
+    def load_card_template(self, image_path: str) -> Image.Image:
+        """
+        Load a card template once and keep the decoded RGB image in memory
+        
+        The returned image is shared and must not be drawn on; use get_card_workspace().
+        """
+        template = self._card_cache.get(image_path)
+        if template is None:
+            with Image.open(image_path) as img:
+                template = img.convert('RGB')
+            self._card_cache[image_path] = template
+            self.logger.info(f"Loaded card template: {image_path}")
+        return template
+    
+    def get_card_workspace(self, image_path: str) -> Image.Image:
+        """
+        Get the reusable working copy of a card template
+        
+        Text drawn on it must be undone with restore_card_workspace() before the next card.
+        """
+        workspace = self._card_workspaces.get(image_path)
+        if workspace is None:
+            workspace = self.load_card_template(image_path).copy()
+            self._card_workspaces[image_path] = workspace
+        return workspace
+    
+    def restore_card_workspace(self, image_path: str, dirty_boxes: List[Tuple[float, float, float, float]]):
+        """
+        Copy the template pixels back over the areas text was drawn on
+        
+        Args:
+            image_path: Path of the template the workspace belongs to
+            dirty_boxes: (left, top, right, bottom) boxes of the drawn text
+        """
+        if not dirty_boxes:
+            return
+        
+        workspace = self._card_workspaces[image_path]
+        template = self._card_cache[image_path]
+        width, height = workspace.size
+        
+        # Union of all boxes, padded by a pixel for anti-aliasing and clipped to the image
+        box = (
+            max(0, int(min(b[0] for b in dirty_boxes)) - 1),
+            max(0, int(min(b[1] for b in dirty_boxes)) - 1),
+            min(width, int(max(b[2] for b in dirty_boxes)) + 2),
+            min(height, int(max(b[3] for b in dirty_boxes)) + 2)
+        )
+        if box[0] < box[2] and box[1] < box[3]:
+            workspace.paste(template.crop(box), box[:2])
+    
+    def load_font(self, font_size: int, custom_font_path: Optional[str] = None) -> ImageFont.FreeTypeFont:
+        """
+        Load the font used for card text, trying the custom font, then common system fonts,
+        then PIL's default font
+        
+        Args:
+            font_size: Size of the font
+            custom_font_path: Path to custom font file
+            
+        Returns:
+            Loaded font, cached per (custom_font_path, font_size)
+        """
+        cache_key = (custom_font_path, font_size)
+        font = self._font_cache.get(cache_key)
+        if font is not None:
+            return font
+        
+        # ================================================================
+        # FONT LOADING SECTION
+        # ================================================================
+        font = None
+        
+        # Option 1: Try custom font if provided
+        if custom_font_path:
+            try:
+                if os.path.exists(custom_font_path):
+                    font = ImageFont.truetype(custom_font_path, font_size)
+                    self.logger.info(f"Using custom font: {custom_font_path} with size {font_size}")
+                else:
+                    self.logger.warning(f"Custom font not found: {custom_font_path}")
+            except Exception as e:
+                self.logger.warning(f"Failed to load custom font {custom_font_path}: {e}")
+        
+        # Option 2: Try system fonts if custom font failed
+        if not font:
+            font_paths = [
+                # Windows fonts
+                "arial.ttf",
+                "calibri.ttf", 
+                "times.ttf",
+                "C:/Windows/Fonts/arial.ttf",
+                "C:/Windows/Fonts/calibri.ttf",
+                "C:/Windows/Fonts/times.ttf",
+                
+                # macOS fonts
+                "/System/Library/Fonts/Arial.ttf",
+                "/System/Library/Fonts/Times.ttc", 
+                "/System/Library/Fonts/Helvetica.ttc",
+                
+                # Linux fonts
+                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+                "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf"
+            ]
+            
+            if self._system_font_path:
+                font_paths = [self._system_font_path]
+            
+            for font_path in font_paths:
+                try:
+                    font = ImageFont.truetype(font_path, font_size)
+                    BirthdayAnniversaryGenerator._system_font_path = font_path
+                    self.logger.info(f"Using system font: {font_path} with size {font_size}")
+                    break
+                except:
+                    continue
+        
+        # Option 3: Fallback to default font
+        if not font:
+            font = ImageFont.load_default()
+            self.logger.warning(f"Using default font with size {font_size} - text may not display optimally")
+        
+        self._font_cache[cache_key] = font
+        return font
+    
+    def text_width(self, draw: ImageDraw.ImageDraw, line: str, font: ImageFont.FreeTypeFont) -> float:
+        """Width of one line of text in the given font, measured once per (font, line)"""
+        key = (font, line)
+        width = self._text_widths.get(key)
+        if width is None:
+            width = self._text_widths[key] = draw.textlength(line, font=font)
+        return width
+    
     def add_text_to_image(self, image_path: str, text: str, 
                          position: tuple = (50, 50), 
                          font_size: int = 40,
@@ -213,120 +620,89 @@ class BirthdayAnniversaryGenerator:
         Returns:
             tuple: (image_bytes, saved_file_path) or (None, None) on error
         """
+        # Areas of the shared workspace that need restoring once this card is saved
+        dirty_boxes: List[Tuple[float, float, float, float]] = []
+        
         try:
-            if not os.path.exists(image_path):
+            # Templates already in memory need no check on disk
+            if image_path not in self._card_cache and not os.path.exists(image_path):
                 raise FileNotFoundError(f"Image file not found: {image_path}")
                 
-            # Open the image
-            with Image.open(image_path) as img:
-                # Convert to RGB if necessary
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Create drawing context
-                draw = ImageDraw.Draw(img)
-                
-                # Convert hex color to RGB
-                rgb_color = self.hex_to_rgb(font_color)
-                
-                # ================================================================
-                # FONT LOADING SECTION
-                # ================================================================
-                font = None
-                
-                # Option 1: Try custom font if provided
-                if custom_font_path:
-                    try:
-                        if os.path.exists(custom_font_path):
-                            font = ImageFont.truetype(custom_font_path, font_size)
-                            self.logger.info(f"Using custom font: {custom_font_path} with size {font_size}")
-                        else:
-                            self.logger.warning(f"Custom font not found: {custom_font_path}")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to load custom font {custom_font_path}: {e}")
-                
-                # Option 2: Try system fonts if custom font failed
-                if not font:
-                    font_paths = [
-                        # Windows fonts
-                        "arial.ttf",
-                        "calibri.ttf", 
-                        "times.ttf",
-                        "C:/Windows/Fonts/arial.ttf",
-                        "C:/Windows/Fonts/calibri.ttf",
-                        "C:/Windows/Fonts/times.ttf",
-                        
-                        # macOS fonts
-                        "/System/Library/Fonts/Arial.ttf",
-                        "/System/Library/Fonts/Times.ttc", 
-                        "/System/Library/Fonts/Helvetica.ttc",
-                        
-                        # Linux fonts
-                        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-                        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf"
-                    ]
+            # Draw on the reusable workspace instead of copying the whole template
+            img = self.get_card_workspace(image_path)
+            
+            # Create drawing context
+            draw = ImageDraw.Draw(img)
+            
+            def stamp(xy: tuple, line: str):
+                """Draw text and remember the area it covered"""
+                dirty_boxes.append(draw.textbbox(xy, line, font=font))
+                draw.text(xy, line, font=font, fill=rgb_color)
+            
+            # Convert hex color to RGB
+            rgb_color = self.hex_to_rgb(font_color)
+            
+            # Fonts are loaded once per size and reused for every card
+            font = self.load_font(font_size, custom_font_path)
+            
+            # Get image dimensions
+            img_width, img_height = img.size
+            
+            # Calculate text positioning
+            if center_align:
+                if multiline:
+                    # Handle multiline text (for anniversary cards)
+                    lines = text.split('\n')
+                    line_height = font_size + 10  # Add some spacing between lines
+                    total_text_height = len(lines) * line_height
                     
-                    for font_path in font_paths:
-                        try:
-                            font = ImageFont.truetype(font_path, font_size)
-                            self.logger.info(f"Using system font: {font_path} with size {font_size}")
-                            break
-                        except:
-                            continue
-                
-                # Option 3: Fallback to default font
-                if not font:
-                    font = ImageFont.load_default()
-                    self.logger.warning(f"Using default font with size {font_size} - text may not display optimally")
-                
-                # Get image dimensions
-                img_width, img_height = img.size
-                
-                # Calculate text positioning
-                if center_align:
-                    if multiline:
-                        # Handle multiline text (for anniversary cards)
-                        lines = text.split('\n')
-                        line_height = font_size + 10  # Add some spacing between lines
-                        total_text_height = len(lines) * line_height
-                        
-                        # Start Y position (use position[1] or center vertically)
-                        start_y = position[1] if position[1] > 0 else (img_height - total_text_height) // 2
-                        
-                        # Draw each line centered
-                        for i, line in enumerate(lines):
-                            line_width = draw.textlength(line, font=font)
-                            line_x = (img_width - line_width) // 2
-                            line_y = start_y + (i * line_height)
-                            draw.text((line_x, line_y), line, font=font, fill=rgb_color)
-                    else:
-                        # Single line text (for birthday cards)
-                        text_width = draw.textlength(text, font=font)
-                        text_x = (img_width - text_width) // 2
-                        text_y = position[1]  # Use provided Y position
-                        draw.text((text_x, text_y), text, font=font, fill=rgb_color)
+                    # Start Y position (use position[1] or center vertically)
+                    start_y = position[1] if position[1] > 0 else (img_height - total_text_height) // 2
+                    
+                    # Draw each line centered
+                    for i, line in enumerate(lines):
+                        line_width = self.text_width(draw, line, font)
+                        line_x = (img_width - line_width) // 2
+                        line_y = start_y + (i * line_height)
+                        stamp((line_x, line_y), line)
                 else:
-                    # Use exact position provided (legacy behavior)
-                    draw.text(position, text, font=font, fill=rgb_color)
-                
-                # Save to bytes
-                img_bytes = io.BytesIO()
-                img.save(img_bytes, format='JPEG', quality=95)
-                img_bytes.seek(0)
-                
-                # Save to output folder
-                if output_filename:
-                    output_path = os.path.join(self.output_folder, output_filename)
-                    img.save(output_path, format='JPEG', quality=95)
-                    self.logger.info(f"Personalized image saved: {output_path}")
-                    return img_bytes.getvalue(), output_path
-                
-                return img_bytes.getvalue(), None
-                
+                    # Single line text (for birthday cards)
+                    text_width = self.text_width(draw, text, font)
+                    text_x = (img_width - text_width) // 2
+                    text_y = position[1]  # Use provided Y position
+                    stamp((text_x, text_y), text)
+            else:
+                # Use exact position provided (legacy behavior)
+                stamp(position, text)
+            
+            # Optionally shrink the card (the email shows it at most 600px wide); the workspace stays full size
+            output_img = img
+            if self.max_width and img.width > self.max_width:
+                output_size = (self.max_width, round(img.height * self.max_width / img.width))
+                output_img = img.resize(output_size, Image.LANCZOS, reducing_gap=2.0)
+            
+            # Encode once; the same bytes are returned and written to the output folder
+            img_bytes = io.BytesIO()
+            output_img.save(img_bytes, format='JPEG', quality=self.jpeg_quality)
+            image_data = img_bytes.getvalue()
+            
+            # Save to output folder
+            if output_filename:
+                output_path = os.path.join(self.output_folder, output_filename)
+                with open(output_path, 'wb') as f:
+                    f.write(image_data)
+                self.logger.info(f"Personalized image saved: {output_path}")
+                return image_data, output_path
+            
+            return image_data, None
+            
         except Exception as e:
             self.log_error(f"Error processing image: {image_path}", e)
             return None, None
+        
+        finally:
+            if dirty_boxes:
+                self.restore_card_workspace(image_path, dirty_boxes)
     
     def find_birthdays_today(self, df: pd.DataFrame) -> List[Dict]:
         """
@@ -339,26 +715,16 @@ class BirthdayAnniversaryGenerator:
             today = datetime.date.today()
             self.logger.info("Checking for birthdays today...")
             
-            # Filter employees with birthdays today
-            birthday_employees = df[
-                (df['birthday'].dt.month == today.month) & 
-                (df['birthday'].dt.day == today.day) &
-                (df['birthday'].notna())
-            ]
+            # Look up employees with birthdays today
+            birthday_employees = self.get_rows_for_date(df, 'birthday', today)
             
             self.logger.info(f"Found {len(birthday_employees)} employees with birthdays today")
             
-            birthdays_today = []
-            for _, employee in birthday_employees.iterrows():
-                birthday_info = {
-                    'first_name': employee['first_name'],
-                    'last_name': employee['last_name'],
-                    'email': employee['email'],
-                    'birthday': employee['birthday'],
-                    'age': today.year - employee['birthday'].year
-                }
-                birthdays_today.append(birthday_info)
-                self.stats['birthdays_today'].append(birthday_info)
+            # Only the matching rows are turned into dictionaries, with ages computed in one pass
+            birthdays_today = birthday_employees[['first_name', 'last_name', 'email', 'birthday']].assign(
+                age=today.year - birthday_employees['birthday'].dt.year
+            ).to_dict('records')
+            self.stats['birthdays_today'].extend(birthdays_today)
             
             return birthdays_today
             
@@ -382,27 +748,16 @@ class BirthdayAnniversaryGenerator:
                 self.logger.warning("No anniversary column found in employee data")
                 return []
             
-            # Filter employees with marriage anniversaries today
-            anniversary_employees = df[
-                (df['anniversary'].dt.month == today.month) & 
-                (df['anniversary'].dt.day == today.day) &
-                (df['anniversary'].notna())
-            ]
+            # Look up employees with marriage anniversaries today
+            anniversary_employees = self.get_rows_for_date(df, 'anniversary', today)
             
             self.logger.info(f"Found {len(anniversary_employees)} employees with marriage anniversaries today")
             
-            anniversaries_today = []
-            for _, employee in anniversary_employees.iterrows():
-                years = today.year - employee['anniversary'].year
-                anniversary_info = {
-                    'first_name': employee['first_name'],
-                    'last_name': employee['last_name'],
-                    'email': employee['email'],
-                    'anniversary': employee['anniversary'],
-                    'years': years
-                }
-                anniversaries_today.append(anniversary_info)
-                self.stats['anniversaries_today'].append(anniversary_info)
+            # Only the matching rows are turned into dictionaries, with years computed in one pass
+            anniversaries_today = anniversary_employees[['first_name', 'last_name', 'email', 'anniversary']].assign(
+                years=today.year - anniversary_employees['anniversary'].dt.year
+            ).to_dict('records')
+            self.stats['anniversaries_today'].extend(anniversaries_today)
             
             return anniversaries_today
             
@@ -410,6 +765,46 @@ class BirthdayAnniversaryGenerator:
             self.log_error("Error finding anniversaries", e)
             return []
     
+    def output_options(self) -> Dict:
+        """Settings that change the rendered card, for recreating this generator in a worker process"""
+        return {'max_width': self.max_width, 'jpeg_quality': self.jpeg_quality}
+    
+    def render_cards(self, image_path: str, cards: List[Tuple[str, str]], **text_options) -> List[Optional[str]]:
+        """
+        Render personalized cards from one template
+        
+        With render_workers > 1 and at least MIN_PARALLEL_CARDS cards, the cards are
+        drawn and encoded in a process pool.
+        The template is decoded once here and handed to the workers, which each
+        load the font once.
+        
+        Args:
+            image_path: Path to the card template image
+            cards: (text, output_filename) for each card
+            **text_options: Keyword arguments passed on to add_text_to_image()
+            
+        Returns:
+            Saved path for each card, in the same order, or None where rendering failed
+        """
+        workers = min(self.render_workers, len(cards))
+        if workers > 1 and len(cards) >= MIN_PARALLEL_CARDS:
+            jobs = [(image_path, text, output_filename, text_options) for text, output_filename in cards]
+            # Hand out cards in about four chunks per worker to cut down on inter-process round trips
+            chunksize = max(1, len(jobs) // (4 * workers))
+            try:
+                templates = {image_path: self.load_card_template(image_path)}
+                with ProcessPoolExecutor(max_workers=workers,
+                                         initializer=_init_render_worker,
+                                         initargs=(self.output_folder, templates, self.output_options())) as pool:
+                    return list(pool.map(_render_card_in_worker, jobs, chunksize=chunksize))
+            except Exception as e:
+                self.log_error("Parallel card rendering failed, rendering in this process instead", e)
+        
+        return [
+            self.add_text_to_image(image_path, text, output_filename=output_filename, **text_options)[1]
+            for text, output_filename in cards
+        ]
+    
     def create_birthday_cards(self, birthdays: List[Dict], birthday_card_path: str,
                              text_position: tuple = (50, 50),
                              font_size: int = 40,
@@ -439,6 +834,9 @@ class BirthdayAnniversaryGenerator:
                 self.log_error(f"Birthday card template not found: {birthday_card_path}")
                 return created_cards
             
+            # Work out the greeting and file name for every card first
+            recipients = []
+            cards = []
             for birthday_info in birthdays:
                 try:
                     first_name = birthday_info['first_name']
@@ -450,28 +848,31 @@ class BirthdayAnniversaryGenerator:
                     # Generate unique filename for this image
                     output_filename = f"birthday_{first_name}_{last_name}_{today.strftime('%Y%m%d')}.jpg"
                     
-                    # Add text to birthday card
-                    image_bytes, saved_path = self.add_text_to_image(
-                        birthday_card_path, 
-                        greeting_text, 
-                        text_position,
-                        font_size,
-                        font_color,
-                        custom_font_path,
-                        output_filename=output_filename,
-                        center_align=center_align,
-                        multiline=False  # Birthday cards are single line
-                    )
+                    recipients.append((first_name, last_name))
+                    cards.append((greeting_text, output_filename))
                     
-                    if saved_path:
-                        created_cards.append(saved_path)
-                        self.stats['birthday_cards_created'] += 1
-                        self.logger.info(f"Created birthday card for {first_name} {last_name}")
-                    else:
-                        self.log_error(f"Failed to create birthday card for {first_name} {last_name}")
-                        
                 except Exception as e:
                     self.log_error(f"Error creating birthday card for {birthday_info.get('first_name', 'Unknown')}", e)
+            
+            # Add text to birthday cards
+            saved_paths = self.render_cards(
+                birthday_card_path,
+                cards,
+                position=text_position,
+                font_size=font_size,
+                font_color=font_color,
+                custom_font_path=custom_font_path,
+                center_align=center_align,
+                multiline=False  # Birthday cards are single line
+            )
+            
+            for (first_name, last_name), saved_path in zip(recipients, saved_paths):
+                if saved_path:
+                    created_cards.append(saved_path)
+                    self.stats['birthday_cards_created'] += 1
+                    self.logger.info(f"Created birthday card for {first_name} {last_name}")
+                else:
+                    self.log_error(f"Failed to create birthday card for {first_name} {last_name}")
                     
         except Exception as e:
             self.log_error("Error in birthday card creation process", e)
@@ -507,6 +908,9 @@ class BirthdayAnniversaryGenerator:
                 self.log_error(f"Anniversary card template not found: {anniversary_card_path}")
                 return created_cards
             
+            # Work out the greeting and file name for every card first
+            recipients = []
+            cards = []
             for anniversary_info in anniversaries:
                 try:
                     first_name = anniversary_info['first_name']
@@ -519,34 +923,58 @@ class BirthdayAnniversaryGenerator:
                     # Generate unique filename for this image
                     output_filename = f"anniversary_{first_name}_{last_name}_{today.strftime('%Y%m%d')}.jpg"
                     
-                    # Add text to anniversary card
-                    image_bytes, saved_path = self.add_text_to_image(
-                        anniversary_card_path, 
-                        greeting_text, 
-                        text_position,
-                        font_size,
-                        font_color,
-                        custom_font_path,
-                        output_filename=output_filename,
-                        center_align=center_align,
-                        multiline=True  # Anniversary cards have name on next line
-                    )
+                    recipients.append((first_name, last_name, years))
+                    cards.append((greeting_text, output_filename))
                     
-                    if saved_path:
-                        created_cards.append(saved_path)
-                        self.stats['anniversary_cards_created'] += 1
-                        self.logger.info(f"Created anniversary card for {first_name} {last_name} ({years} years)")
-                    else:
-                        self.log_error(f"Failed to create anniversary card for {first_name} {last_name}")
-                        
                 except Exception as e:
                     self.log_error(f"Error creating anniversary card for {anniversary_info.get('first_name', 'Unknown')}", e)
+            
+            # Add text to anniversary cards
+            saved_paths = self.render_cards(
+                anniversary_card_path,
+                cards,
+                position=text_position,
+                font_size=font_size,
+                font_color=font_color,
+                custom_font_path=custom_font_path,
+                center_align=center_align,
+                multiline=True  # Anniversary cards have name on next line
+            )
+            
+            for (first_name, last_name, years), saved_path in zip(recipients, saved_paths):
+                if saved_path:
+                    created_cards.append(saved_path)
+                    self.stats['anniversary_cards_created'] += 1
+                    self.logger.info(f"Created anniversary card for {first_name} {last_name} ({years} years)")
+                else:
+                    self.log_error(f"Failed to create anniversary card for {first_name} {last_name}")
                     
         except Exception as e:
             self.log_error("Error in anniversary card creation process", e)
             
         return created_cards
     
+    def template_cards(self, birthdays: List[Dict], birthday_card_path: str,
+                       anniversaries: List[Dict], anniversary_card_path: str) -> Tuple[List[str], List[str]]:
+        """
+        Use the card templates as they are, one per employee, instead of rendering names onto them
+        
+        Returns:
+            (birthday card paths, anniversary card paths); empty where the template is missing
+        """
+        card_lists = []
+        for people, card_path, kind in ((birthdays, birthday_card_path, 'Birthday'),
+                                        (anniversaries, anniversary_card_path, 'Anniversary')):
+            if people and not os.path.exists(card_path):
+                self.log_error(f"{kind} card template not found: {card_path}")
+                card_lists.append([])
+            else:
+                card_lists.append([card_path] * len(people))
+        
+        self.logger.info(f"Card personalization disabled, using templates for {len(card_lists[0])} birthday "
+                         f"and {len(card_lists[1])} anniversary emails")
+        return card_lists[0], card_lists[1]
+    
     def process_daily_cards(self, csv_file: str, birthday_card_path: str, 
                            anniversary_card_path: str,
                            birthday_text_pos: tuple = (50, 50),
@@ -558,10 +986,14 @@ class BirthdayAnniversaryGenerator:
                            birthday_font_path: Optional[str] = None,
                            anniversary_font_path: Optional[str] = None,
                            birthday_center_align: bool = False,
-                           anniversary_center_align: bool = True) -> Dict:
+                           anniversary_center_align: bool = True,
+                           personalize: bool = True) -> Dict:
         """
         Process daily cards for both birthdays and anniversaries
         
+        With personalize=False no cards are rendered; every employee is given the
+        unchanged template and the greeting is expected to go in the email text.
+        
         Returns:
             Dictionary with results and statistics
         """
@@ -579,6 +1011,20 @@ class BirthdayAnniversaryGenerator:
             birthdays_today = self.find_birthdays_today(df)
             anniversaries_today = self.find_anniversaries_today(df)
             
+            if not personalize:
+                birthday_cards, anniversary_cards = self.template_cards(
+                    birthdays_today, birthday_card_path,
+                    anniversaries_today, anniversary_card_path
+                )
+                return {
+                    'success': True,
+                    'birthdays_today': birthdays_today,
+                    'anniversaries_today': anniversaries_today,
+                    'birthday_cards_created': birthday_cards,
+                    'anniversary_cards_created': anniversary_cards,
+                    'stats': self.stats
+                }
+            
             # Create birthday cards
             birthday_cards = []
             if birthdays_today:
@@ -623,6 +1069,9 @@ class BirthdayAnniversaryGenerator:
         except Exception as e:
             self.log_error("Critical error in daily card processing", e)
             return {'success': False, 'error': str(e)}
+        
+        finally:
+            self.flush_logs()
 
 
 # Example usage
@@ -639,17 +1088,17 @@ def main():
     ANNIVERSARY_CARD = os.getenv('ANNIVERSARY_CARD', 'assets\\Slide1.PNG')
     
     # Text positioning for 1280x720 images from .env
-    BIRTHDAY_TEXT_X = int(os.getenv('BIRTHDAY_TEXT_X', '50'))
-    BIRTHDAY_TEXT_Y = int(os.getenv('BIRTHDAY_TEXT_Y', '300'))
-    ANNIVERSARY_TEXT_X = int(os.getenv('ANNIVERSARY_TEXT_X', '0'))
-    ANNIVERSARY_TEXT_Y = int(os.getenv('ANNIVERSARY_TEXT_Y', '200'))
+    BIRTHDAY_TEXT_X = getenv_int('BIRTHDAY_TEXT_X', '50')
+    BIRTHDAY_TEXT_Y = getenv_int('BIRTHDAY_TEXT_Y', '300')
+    ANNIVERSARY_TEXT_X = getenv_int('ANNIVERSARY_TEXT_X', '0')
+    ANNIVERSARY_TEXT_Y = getenv_int('ANNIVERSARY_TEXT_Y', '200')
     
     BIRTHDAY_TEXT_POSITION = (BIRTHDAY_TEXT_X, BIRTHDAY_TEXT_Y)
     ANNIVERSARY_TEXT_POSITION = (ANNIVERSARY_TEXT_X, ANNIVERSARY_TEXT_Y)
     
     # Font customization from .env
-    BIRTHDAY_FONT_SIZE = int(os.getenv('BIRTHDAY_FONT_SIZE', '64'))
-    ANNIVERSARY_FONT_SIZE = int(os.getenv('ANNIVERSARY_FONT_SIZE', '72'))
+    BIRTHDAY_FONT_SIZE = getenv_int('BIRTHDAY_FONT_SIZE', '64')
+    ANNIVERSARY_FONT_SIZE = getenv_int('ANNIVERSARY_FONT_SIZE', '72')
     BIRTHDAY_FONT_COLOR = os.getenv('BIRTHDAY_FONT_COLOR', '#4b446a')
     ANNIVERSARY_FONT_COLOR = os.getenv('ANNIVERSARY_FONT_COLOR', '#72719f')
     
@@ -658,8 +1107,8 @@ def main():
     ANNIVERSARY_FONT_PATH = os.getenv('ANNIVERSARY_FONT_PATH', 'C:/Windows/Fonts/HTOWERT.TTF')
     
     # Alignment from .env
-    BIRTHDAY_CENTER_ALIGN = os.getenv('BIRTHDAY_CENTER_ALIGN', 'false').lower() == 'true'
-    ANNIVERSARY_CENTER_ALIGN = os.getenv('ANNIVERSARY_CENTER_ALIGN', 'true').lower() == 'true'
+    BIRTHDAY_CENTER_ALIGN = getenv_bool('BIRTHDAY_CENTER_ALIGN', 'false')
+    ANNIVERSARY_CENTER_ALIGN = getenv_bool('ANNIVERSARY_CENTER_ALIGN', 'true')
     
     print("🚀 Starting Birthday & Anniversary Card Generator")
     print(f"📁 Output Folder: {OUTPUT_FOLDER}")
@@ -44,7 +44,8 @@ def generate_employee_csv(filename="employees.csv", num_employees=100):
         # Write header
         writer.writerow(['first_name', 'last_name', 'email', 'birthday', 'anniversary', 'department'])
         
-        # Generate employee records
+        # Generate employee records, then write them in one call
+        rows = []
         for i in range(num_employees):
             first_name = random.choice(first_names)
             last_name = random.choice(last_names)
@@ -75,8 +76,9 @@ def generate_employee_csv(filename="employees.csv", num_employees=100):
             # Random department
             department = random.choice(departments)
             
-            # Write row
-            writer.writerow([first_name, last_name, email, birthday, anniversary, department])
+            rows.append([first_name, last_name, email, birthday, anniversary, department])
+        
+        writer.writerows(rows)
     
     print(f"✅ Generated {num_employees} employee records in '{filename}'")
     print(f"📄 File location: {filename}")
@@ -103,8 +105,7 @@ def generate_specific_csv():
         writer.writerow(['first_name', 'last_name', 'email', 'birthday', 'anniversary', 'department'])
         
         # Write employee data
-        for employee in employees_data:
-            writer.writerow(employee)
+        writer.writerows(employees_data)
     
     print(f"✅ Generated exact example CSV: '{filename}'")
     return filename
@@ -132,8 +133,7 @@ def generate_today_birthdays_csv(num_today=5):
         writer.writerow(['first_name', 'last_name', 'email', 'birthday', 'anniversary', 'department'])
         
         # Write today's birthday employees
-        for employee in todays_employees[:num_today]:
-            writer.writerow(employee)
+        writer.writerows(todays_employees[:num_today])
     
     print(f"✅ Generated test CSV with {num_today} birthdays today: '{filename}'")
     return filename
@@ -10,7 +10,7 @@ from urllib.parse import quote
 import traceback
 
 # Import the card generator
-from card_generation import BirthdayAnniversaryGenerator
+from card_generation import BirthdayAnniversaryGenerator, getenv_bool, getenv_int
 
 class OutlookEmailSender:
     """
@@ -593,22 +593,32 @@ TOTAL SUMMARY:
 
         """
         
+        # Collect sections in a list and join once instead of growing the string
+        parts = [report]
+        
         if self.stats['birthdays_today']:
-            report += "\nBIRTHDAYS TODAY:\n"
-            for birthday in self.stats['birthdays_today']:
-                report += f"- {birthday['name']} ({birthday['email']}) - Age: {birthday['age']}\n"
+            parts.append("\nBIRTHDAYS TODAY:\n")
+            parts.extend(
+                f"- {birthday['name']} ({birthday['email']}) - Age: {birthday['age']}\n"
+                for birthday in self.stats['birthdays_today']
+            )
         
         if self.stats['anniversaries_today']:
-            report += "\nANNIVERSARIES TODAY:\n"
-            for anniversary in self.stats['anniversaries_today']:
-                report += f"- {anniversary['name']} ({anniversary['email']}) - {anniversary['years']} years\n"
+            parts.append("\nANNIVERSARIES TODAY:\n")
+            parts.extend(
+                f"- {anniversary['name']} ({anniversary['email']}) - {anniversary['years']} years\n"
+                for anniversary in self.stats['anniversaries_today']
+            )
         
         if self.stats['errors']:
-            report += f"\nERRORS ENCOUNTERED ({len(self.stats['errors'])}):\n"
-            for i, error in enumerate(self.stats['errors'], 1):
-                report += f"{i}. {error['timestamp']} - {error['message']}\n"
-                if error['exception']:
-                    report += f"   Exception: {error['exception']}\n"
+            parts.append(f"\nERRORS ENCOUNTERED ({len(self.stats['errors'])}):\n")
+            parts.extend(
+                f"{i}. {error['timestamp']} - {error['message']}\n"
+                + (f"   Exception: {error['exception']}\n" if error['exception'] else "")
+                for i, error in enumerate(self.stats['errors'], 1)
+            )
+        
+        report = ''.join(parts)
         
         return report
     
@@ -656,20 +666,20 @@ TOTAL SUMMARY:
             self.logger.info(f"Anniversary card template: {anniversary_card_path}")
             
             # Birthday configuration
-            birthday_text_x = int(os.getenv('BIRTHDAY_TEXT_X', '50'))
-            birthday_text_y = int(os.getenv('BIRTHDAY_TEXT_Y', '300'))
-            birthday_font_size = int(os.getenv('BIRTHDAY_FONT_SIZE', '64'))
+            birthday_text_x = getenv_int('BIRTHDAY_TEXT_X', '50')
+            birthday_text_y = getenv_int('BIRTHDAY_TEXT_Y', '300')
+            birthday_font_size = getenv_int('BIRTHDAY_FONT_SIZE', '64')
             birthday_font_color = os.getenv('BIRTHDAY_FONT_COLOR', '#4b446a')
             birthday_font_path = os.getenv('BIRTHDAY_FONT_PATH', 'fonts/Inkfree.ttf')
-            birthday_center_align = os.getenv('BIRTHDAY_CENTER_ALIGN', 'false').lower() == 'true'
+            birthday_center_align = getenv_bool('BIRTHDAY_CENTER_ALIGN', 'false')
             
             # Anniversary configuration
-            anniversary_text_x = int(os.getenv('ANNIVERSARY_TEXT_X', '0'))
-            anniversary_text_y = int(os.getenv('ANNIVERSARY_TEXT_Y', '200'))
-            anniversary_font_size = int(os.getenv('ANNIVERSARY_FONT_SIZE', '72'))
+            anniversary_text_x = getenv_int('ANNIVERSARY_TEXT_X', '0')
+            anniversary_text_y = getenv_int('ANNIVERSARY_TEXT_Y', '200')
+            anniversary_font_size = getenv_int('ANNIVERSARY_FONT_SIZE', '72')
             anniversary_font_color = os.getenv('ANNIVERSARY_FONT_COLOR', '#72719f')
             anniversary_font_path = os.getenv('ANNIVERSARY_FONT_PATH', 'C:/Windows/Fonts/HTOWERT.TTF')
-            anniversary_center_align = os.getenv('ANNIVERSARY_CENTER_ALIGN', 'true').lower() == 'true'
+            anniversary_center_align = getenv_bool('ANNIVERSARY_CENTER_ALIGN', 'true')
             
             self.logger.info(f"Birthday config: pos=({birthday_text_x},{birthday_text_y}), size={birthday_font_size}, color={birthday_font_color}, center={birthday_center_align}")
             self.logger.info(f"Anniversary config: pos=({anniversary_text_x},{anniversary_text_y}), size={anniversary_font_size}, color={anniversary_font_color}, center={anniversary_center_align}")